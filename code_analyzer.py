@@ -0,0 +1,249 @@
+"""
+CodeAnalyzer module for analyzing code structure and relationships.
+"""
+
+import os
+import ast
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+
+_DEF_RE = re.compile(r'def\s+(\w+)\s*\(')
+
+
+@lru_cache(maxsize=64)
+def _parse_file(file_path: str, mtime_ns: int, size: int) -> Tuple[str, List[str], ast.Module]:
+    """Read and parse a file once per (path, mtime, size)."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return content, content.splitlines(), ast.parse(content)
+
+
+def _load(file_path: str) -> Tuple[str, List[str], ast.Module]:
+    """Return (content, lines, tree) for a file, re-parsing only when it changes."""
+    # The size catches rewrites that land within the filesystem's mtime resolution
+    stat = os.stat(file_path)
+    return _parse_file(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+class _FunctionDefCollector(ast.NodeVisitor):
+    """Collect FunctionDef nodes, descending through statements only.
+    
+    Function definitions can never appear inside an expression, so skipping
+    expression subtrees (calls, literals, comprehensions, ...) visits far
+    fewer nodes than ast.walk without missing any.
+    """
+    
+    def __init__(self, nested: bool):
+        self.nested = nested
+        self.functions: List[ast.FunctionDef] = []
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions.append(node)
+        if self.nested:
+            self.generic_visit(node)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, ast.expr):
+                self.visit(child)
+
+
+def _collect_functions(tree: ast.Module, nested: bool) -> List[ast.FunctionDef]:
+    """Return the functions of a module, optionally including nested ones."""
+    collector = _FunctionDefCollector(nested)
+    collector.visit(tree)
+    return collector.functions
+
+
+@lru_cache(maxsize=64)
+def _function_index(tree: ast.Module) -> Tuple[List[int], List[ast.FunctionDef]]:
+    """Index the outermost functions of a module by their first line."""
+    # Nested functions are part of their outer one, so ranges never overlap
+    functions = sorted(_collect_functions(tree, nested=False), key=lambda node: node.lineno)
+    return [node.lineno for node in functions], functions
+
+
+def _find_function(tree: ast.Module, line_number: int) -> Optional[ast.FunctionDef]:
+    """Return the outermost function containing the given line, if any."""
+    starts, functions = _function_index(tree)
+    i = bisect_right(starts, line_number) - 1
+    if i >= 0 and functions[i].end_lineno >= line_number:
+        return functions[i]
+    return None
+
+
+@lru_cache(maxsize=64)
+def _tests_by_target(tree: ast.Module) -> Dict[str, List[Tuple[int, int]]]:
+    """Map each candidate target-function name to the (lineno, end_lineno) of its tests.
+    
+    test_calculate_discount_boundary is filed under every run of words in its
+    name (calculate, calculate_discount, discount_boundary, ...), so a
+    function name is looked up directly instead of scanning every test.
+    """
+    tests_by_target = {}
+    for node in _collect_functions(tree, nested=True):
+        if not node.name.startswith('test_'):
+            continue
+        tokens = node.name[5:].lower().split('_')
+        targets = {
+            '_'.join(tokens[start:end])
+            for start in range(len(tokens))
+            for end in range(start + 1, len(tokens) + 1)
+        }
+        for target in targets:
+            tests_by_target.setdefault(target, []).append((node.lineno, node.end_lineno))
+    return tests_by_target
+
+
+class CodeAnalyzer:
+    """Analyzes code structure and relationships."""
+    
+    @staticmethod
+    def map_test_to_source_files(source_files: List[str], test_files: List[str]) -> Dict[str, str]:
+        """Map test files to their corresponding source files."""
+        mapping = {}
+        
+        source_base_names = {os.path.splitext(os.path.basename(f))[0]: f for f in source_files}
+        
+        for test_file in test_files:
+            test_name = os.path.splitext(os.path.basename(test_file))[0]
+            
+            # Handle common naming patterns
+            if test_name.startswith('test_'):
+                source_name = test_name.removeprefix('test_')
+            elif test_name.endswith('_test'):
+                source_name = test_name.removesuffix('_test')
+            else:
+                source_name = None
+            
+            if source_name in source_base_names:
+                mapping[source_base_names[source_name]] = test_file
+        
+        return mapping
+    
+    @staticmethod
+    def warm_cache(*file_paths: str) -> None:
+        """Read and parse the given files ahead of prompt creation."""
+        for file_path in file_paths:
+            _load(file_path)
+    
+    @staticmethod
+    def _function_context(source_file: str, test_file: str, line_number: int) -> Tuple[str, Optional[str], str]:
+        """Return (module_name, function_code, existing_tests) around a source line."""
+        # Load the source file to extract the relevant function
+        _, source_lines, tree = _load(source_file)
+        
+        # Load the test file to extract existing tests
+        _, test_lines, test_tree = _load(test_file)
+        
+        # Find the function containing the mutation
+        function_name = None
+        function_code = None
+        
+        node = _find_function(tree, line_number)
+        if node is not None:
+            function_name = node.name
+            function_code = '\n'.join(source_lines[node.lineno-1:node.end_lineno])
+        
+        if not function_name or not function_code:
+            # If we couldn't find the function, use a more generic approach
+            # Extract a few lines around the mutation
+            start_line = max(0, line_number - 5)
+            end_line = min(len(source_lines), line_number + 5)
+            context_code = '\n'.join(source_lines[start_line:end_line])
+            
+            # Try to extract the function name from the context
+            match = _DEF_RE.search(context_code) if 'def' in context_code else None
+            if match:
+                function_name = match.group(1)
+            else:
+                function_name = "unknown_function"
+        
+        # Extract existing tests for this function
+        existing_tests = ""
+        for lineno, end_lineno in _tests_by_target(test_tree).get(function_name.lower(), []):
+            existing_tests += '\n'.join(test_lines[lineno-1:end_lineno]) + '\n\n'
+        
+        module_name = os.path.splitext(os.path.basename(source_file))[0]
+        return module_name, function_code, existing_tests
+    
+    @staticmethod
+    def group_mutants_by_function(source_file: str, mutants: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group mutants by the function containing them, in order of first appearance.
+        
+        Mutants outside any function each form a group of their own.
+        """
+        _, _, tree = _load(source_file)
+        groups = {}
+        for i, mutant in enumerate(mutants):
+            node = _find_function(tree, mutant['line_number'])
+            groups.setdefault(node if node is not None else i, []).append(mutant)
+        return list(groups.values())
+    
+    @staticmethod
+    def create_prompt_for_mutant(source_file: str, test_file: str, mutant: Dict[str, Any]) -> str:
+        """Create a prompt for the LLM to generate a test for the given mutant."""
+        module_name, function_code, existing_tests = CodeAnalyzer._function_context(
+            source_file, test_file, mutant['line_number']
+        )
+        
+        # Create the prompt
+        prompt = f"""
+I have a function in module '{module_name}':
+
+{function_code}
+
+My current test(s) for this function:
+
+{existing_tests}
+
+I found a bug where changing '{mutant['original_line']}' to '{mutant['mutated_line']}' at line {mutant['line_number']} isn't caught by my test suite.
+
+Please generate a new test method that would detect this change. The test should pass on the original code but fail if the mutation is applied.
+
+Return only the Python code for the test method, properly indented and with docstrings explaining what it tests.
+"""
+        
+        return prompt
+    
+    @staticmethod
+    def create_prompt_for_mutants(source_file: str, test_file: str, mutants: List[Dict[str, Any]]) -> str:
+        """Create one prompt asking for a test per mutant, for mutants in the same function.
+        
+        The function and its existing tests are sent once for the whole group
+        instead of once per mutant.
+        """
+        if len(mutants) == 1:
+            return CodeAnalyzer.create_prompt_for_mutant(source_file, test_file, mutants[0])
+        
+        module_name, function_code, existing_tests = CodeAnalyzer._function_context(
+            source_file, test_file, mutants[0]['line_number']
+        )
+        changes = '\n'.join(
+            f"{i}. Changing '{mutant['original_line']}' to '{mutant['mutated_line']}' at line {mutant['line_number']}"
+            for i, mutant in enumerate(mutants, 1)
+        )
+        
+        # Create the prompt
+        prompt = f"""
+I have a function in module '{module_name}':
+
+{function_code}
+
+My current test(s) for this function:
+
+{existing_tests}
+
+I found {len(mutants)} bugs in this function that my test suite doesn't catch:
+
+{changes}
+
+Please generate one new test method for each change, in the same order, that would detect it. Each test should pass on the original code but fail if its mutation is applied.
+
+Return only the Python code for the {len(mutants)} test methods, properly indented, separated by a blank line and with docstrings explaining what they test.
+"""
+        
+        return prompt
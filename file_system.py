@@ -0,0 +1,215 @@
+"""
+FileSystem module for handling file system operations.
+"""
+
+import os
+import re
+import ast
+import shutil
+import hashlib
+import logging
+import textwrap
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SKIPPED_DIRS = {'__pycache__', 'venv', 'node_modules', 'build', 'dist'}
+
+# Contents returned by read_file, keyed by path and validated by (mtime_ns, size)
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+_TEST_CLASS_RE = re.compile(r'\s*class\s+Test\w*')
+
+
+def _scan_last_test_class_end(lines: List[str]) -> Optional[int]:
+    """Find the last line of the last top-level Test* class with a line scan.
+    
+    Returns None when the layout is ambiguous without a real parse, e.g. a
+    multi-line string or a continuation line that reaches column 0.
+    """
+    class_start = None
+    for i, line in enumerate(lines):
+        if _TEST_CLASS_RE.match(line):
+            class_start = i
+    if class_start is None or lines[class_start][0].isspace():
+        return None
+    
+    end_line = class_start + 1
+    depth = 0
+    for i in range(class_start, len(lines)):
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if i > class_start and not line[0].isspace():
+            if depth:
+                return None
+            break
+        if line.count('"""') % 2 or line.count("'''") % 2 or stripped.endswith('\\'):
+            return None
+        depth += sum(map(line.count, '([{')) - sum(map(line.count, ')]}'))
+        end_line = i + 1
+    return end_line
+
+
+def _parse_last_test_class_end(content: str) -> int:
+    """Find the last line of the last Test* class using the AST."""
+    last_class_line = 0
+    pending = list(ast.parse(content).body)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ast.ClassDef) and node.name.startswith('Test'):
+            # Anything nested in this class ends within it
+            last_class_line = max(last_class_line, node.end_lineno)
+            continue
+        # Classes are statements, so expression subtrees never hold one
+        pending.extend(child for child in ast.iter_child_nodes(node)
+                       if not isinstance(child, ast.expr))
+    return last_class_line
+
+
+
+def _indent_test_block(test: str, indent: str) -> Optional[str]:
+    """Re-indent a generated test block for a class body, or None if it is not valid there.
+    
+    Blocks may arrive at column 0 or already indented for a class, so their
+    common indentation is removed before adding the class indentation.
+    """
+    block = textwrap.indent(textwrap.dedent(test).strip(), indent)
+    try:
+        ast.parse(f"class _GeneratedTests:\n{block}\n")
+    except SyntaxError:
+        return None
+    return block
+
+
+class FileSystem:
+    """Handles file system operations."""
+    
+    @staticmethod
+    def list_python_files(directory: str) -> List[str]:
+        """List all Python files in a directory recursively."""
+        python_files = []
+        pending = [directory]
+        while pending:
+            # Missing, unreadable or non-directory paths hold no files to list
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    # Hidden entries are skipped, as glob would skip them
+                    if entry.name.startswith('.'):
+                        continue
+                    # DirEntry caches the file type, so these checks need no extra stat
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIPPED_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        python_files.append(entry.path)
+        return python_files
+    
+    @staticmethod
+    def read_file(file_path: str) -> str:
+        """Read the contents of a file, reusing the previous read if it is unchanged."""
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _FILE_CACHE.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        _FILE_CACHE[file_path] = (signature, content)
+        return content
+    
+    @staticmethod
+    def hash_files(*file_paths: str) -> str:
+        """Return a SHA-256 digest over the contents of the given files."""
+        digest = hashlib.sha256()
+        for i, file_path in enumerate(file_paths):
+            if i:
+                digest.update(b'\0')
+            with open(file_path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def write_file(file_path: str, content: str) -> bool:
+        """Write content to a file atomically, so no reader sees it half-written."""
+        _FILE_CACHE.pop(file_path, None)
+        temp_path = f"{file_path}.tmp-{os.getpid()}"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                shutil.copymode(file_path, temp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(temp_path, file_path)
+            return True
+        except Exception as e:
+            logger.error(f"Error writing to file {file_path}: {e}")
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            return False
+    
+    @staticmethod
+    def update_test_file(test_file: str, new_tests: List[str]) -> bool:
+        """Update a test file with new test methods."""
+        try:
+            content = FileSystem.read_file(test_file)
+            
+            # Split the content into lines
+            lines = content.split('\n')
+            
+            # Find the last line of the last test class, parsing only if the scan is unsure
+            last_class_line = _scan_last_test_class_end(lines)
+            if last_class_line is None:
+                last_class_line = _parse_last_test_class_end(content)
+            
+            if last_class_line == 0:
+                # No test class found, can't update
+                logger.error(f"No test class found in {test_file}")
+                return False
+            
+            # Insert the new tests right after the class's last line, which keeps
+            # them ahead of anything following the class, such as an
+            # "if __name__" guard. The original text is sliced around them
+            # rather than re-joining its lines, and all fragments are joined
+            # once at the end.
+            class_end = sum(map(len, lines[:last_class_line])) + last_class_line - 1
+            indent = '    '  # Assuming 4-space indentation
+            parts = [content[:class_end]]
+            
+            for test in new_tests:
+                # Make sure the test is properly indented
+                block = _indent_test_block(test, indent)
+                if block is None:
+                    logger.warning(f"Skipping generated test that is not valid Python:\n{test}")
+                    continue
+                parts.append(block)
+            
+            if len(parts) == 1:
+                logger.error(f"No valid tests to add to {test_file}")
+                return False
+            
+            # Never write a test file that no longer parses
+            updated_content = '\n\n'.join(parts) + (content[class_end:] or '\n')
+            try:
+                ast.parse(updated_content)
+            except SyntaxError as e:
+                logger.error(f"Adding the generated tests would break {test_file}: {e}")
+                return False
+            
+            # Write the updated content back
+            return FileSystem.write_file(test_file, updated_content)
+            
+        except Exception as e:
+            logger.error(f"Error updating test file: {e}")
+            return False
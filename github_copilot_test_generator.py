@@ -0,0 +1,323 @@
+"""
+GitHub Copilot Test Generator module for generating tests using GitHub Copilot.
+"""
+
+import os
+import re
+import ast
+import functools
+import platform
+import subprocess
+import tempfile
+import textwrap
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from prompt_cache import PromptCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mutation_guided', 'copilot_cache.db')
+
+# Comment line ending the prompt in the prompt file; Copilot's test follows it
+_PROMPT_MARKER = "# Copilot, please generate the test below:"
+
+_DEF_LINE_RE = re.compile(r'^[ \t]*def ', re.M)
+
+class GithubCopilotTestGenerator:
+    """Generates tests using GitHub Copilot."""
+    
+    def __init__(self, vscode_executable_path=None, max_workers: int = 8,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH):
+        """
+        Initialize with VS Code executable path if provided.
+        
+        Args:
+            vscode_executable_path: Path to the VS Code executable 
+                                   (defaults to common locations if not provided)
+            max_workers: Maximum number of Copilot sessions generate_tests_batch
+                         keeps open at once
+            cache_path: Path of the on-disk cache of generated tests, keyed by
+                        prompt hash (None disables the cache)
+        """
+        self.vscode_executable_path = vscode_executable_path or self._find_vscode_executable()
+        self.max_workers = max_workers
+        self._cache = PromptCache(cache_path) if cache_path else None
+        
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _find_vscode_executable() -> str:
+        """Find VS Code executable based on platform (looked up once per process)."""
+        system = platform.system()
+        
+        if system == "Windows":
+            # Look in common Windows locations
+            paths = [
+                os.path.expandvars("%LOCALAPPDATA%\\Programs\\Microsoft VS Code\\Code.exe"),
+                os.path.expandvars("%ProgramFiles%\\Microsoft VS Code\\Code.exe"),
+                os.path.expandvars("%ProgramFiles(x86)%\\Microsoft VS Code\\Code.exe")
+            ]
+        elif system == "Darwin":  # macOS
+            paths = [
+                "/Applications/Visual Studio Code.app/Contents/Resources/app/bin/code"
+            ]
+        else:  # Linux and others
+            paths = [
+                "/usr/bin/code",
+                "/usr/local/bin/code",
+                os.path.expanduser("~/.local/bin/code")
+            ]
+            
+        for path in paths:
+            if os.path.isfile(path):
+                return path
+                
+        logger.warning("VS Code executable not found. Please specify path manually.")
+        return "code"  # Default command, may work if VS Code is in PATH
+    
+    @staticmethod
+    def _write_prompt_file(prompt: str) -> str:
+        """Write the prompt as Python comments to a temporary file and return its path."""
+        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as temp_file:
+            # Format prompt as Python comments
+            formatted_prompt = '\n'.join([f"# {line}" for line in prompt.strip().split('\n')])
+            
+            # Add a marker where we want Copilot to start generating
+            temp_file.write(f"{formatted_prompt}\n\n{_PROMPT_MARKER}\n\ndef ")
+        return temp_file.name
+    
+    @staticmethod
+    def _read_generated_test(temp_file_path: str) -> str:
+        """Extract the generated test from the prompt file once the editor is done with it."""
+        # Re-open by path: the editor may have replaced the file on save,
+        # so a handle kept open from before could still see the old content
+        with open(temp_file_path, 'r') as f:
+            content = f.read()
+        
+        # The commented prompt quotes code of its own, so only look past the
+        # marker, and only at defs starting a line
+        marker = content.find(_PROMPT_MARKER)
+        search_start = marker + len(_PROMPT_MARKER) if marker != -1 else 0
+        first_def = _DEF_LINE_RE.search(content, search_start)
+        if first_def is None:
+            return ""
+        # Keep the def line's indentation so a method written inside a class
+        # is dedented as a whole, keeping its relative indentation
+        return textwrap.dedent(content[first_def.start():]).strip()
+    
+    @staticmethod
+    def _is_valid_test(test_code: str) -> bool:
+        """Return whether test_code parses and defines at least one test method."""
+        try:
+            tree = ast.parse(test_code)
+        except SyntaxError:
+            return False
+        return any(isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) for node in tree.body)
+    
+    @staticmethod
+    def _remove_temp_files(*file_paths: str) -> None:
+        """Delete temporary files, logging instead of raising on failure."""
+        for file_path in file_paths:
+            try:
+                os.unlink(file_path)
+            except OSError as e:
+                logger.warning(f"Failed to delete temporary file: {e}")
+    
+    def generate_test(self, prompt: str) -> str:
+        """
+        Generate a test method using GitHub Copilot.
+        
+        Args:
+            prompt: The prompt for generating a test
+            
+        Returns:
+            Generated test code as string
+        """
+        try:
+            # The prompt embeds the function's code and the mutations, so an
+            # unchanged prompt can reuse the test accepted for it last time
+            key = PromptCache.key(prompt)
+            cached = self._cache.get(key) if self._cache is not None else None
+            if cached is not None:
+                logger.info("Using cached Copilot response for this prompt")
+                return cached
+            
+            # Create a temporary Python file with the prompt as a comment
+            temp_file_path = self._write_prompt_file(prompt)
+            
+            # Use VS Code command line to open file and invoke Copilot
+            try:
+                # Open VS Code with the temp file
+                logger.info(f"Opening temporary file in VS Code: {temp_file_path}")
+                
+                # Command to open VS Code and wait for it
+                cmd = [
+                    self.vscode_executable_path,
+                    "--reuse-window",  # Open as a tab in the running VS Code instance
+                    "--wait",  # Wait for the file to be closed before returning
+                    temp_file_path
+                ]
+                
+                # Start VS Code
+                logger.info("Starting VS Code...")
+                subprocess.run(cmd, check=True)
+                
+                # Extract the generated test
+                # This assumes the user accepted the Copilot suggestion and saved the file
+                test_code = self._read_generated_test(temp_file_path)
+                if test_code:
+                    logger.info("Successfully retrieved test code from Copilot")
+                    # Only a test that parses is worth offering again for this prompt
+                    if self._cache is not None and self._is_valid_test(test_code):
+                        self._cache.put(key, test_code)
+                else:
+                    logger.warning("No test code was generated or accepted.")
+                return test_code
+                    
+            finally:
+                # Clean up the temporary file
+                self._remove_temp_files(temp_file_path)
+        
+        except Exception as e:
+            logger.error(f"Error generating test with GitHub Copilot: {e}")
+            return ""
+    
+    def generate_tests_batch(self, prompts: List[str]) -> List[str]:
+        """Generate a test method for each prompt concurrently, preserving order."""
+        if not prompts:
+            return []
+        
+        # Each call just waits on a VS Code process, so threads overlap the sessions
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(prompts))) as executor:
+            return list(executor.map(self.generate_test, prompts))
+    
+    def generate_test_with_cli(self, prompt: str) -> str:
+        """
+        Alternative implementation using the GitHub Copilot CLI if available.
+        This requires the GitHub Copilot CLI to be installed.
+        
+        Args:
+            prompt: The prompt for generating a test
+            
+        Returns:
+            Generated test code as string
+        """
+        try:
+            # Create a temporary file to store the output
+            with tempfile.NamedTemporaryFile(suffix='.txt', mode='w', delete=False) as output_file:
+                output_file_path = output_file.name
+            
+            try:
+                # Build the command for GitHub Copilot CLI
+                cmd = [
+                    "github-copilot",
+                    "suggest",
+                    "--output-file", output_file_path,
+                    prompt
+                ]
+                
+                # Run the command
+                logger.info("Running GitHub Copilot CLI...")
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                
+                if result.returncode != 0:
+                    logger.error(f"GitHub Copilot CLI failed: {result.stderr}")
+                    return ""
+                
+                # Read the generated test from the output file
+                with open(output_file_path, 'r') as f:
+                    return f.read().strip()
+            
+            finally:
+                # Clean up
+                self._remove_temp_files(output_file_path)
+            
+        except Exception as e:
+            logger.error(f"Error using GitHub Copilot CLI: {e}")
+            return ""
+            
+    def generate_test_headless(self, prompt: str) -> str:
+        """
+        Headless implementation using VS Code's built-in API capabilities.
+        This requires VS Code to be installed with the Copilot extension.
+        
+        Args:
+            prompt: The prompt for generating a test
+            
+        Returns:
+            Generated test code as string
+        """
+        try:
+            # Create a temporary file with the prompt
+            temp_file_path = self._write_prompt_file(prompt)
+            temp_files = [temp_file_path]
+            
+            try:
+                # Create a script to automate VS Code
+                escaped_path = temp_file_path.replace('\\', '\\\\')
+                with tempfile.NamedTemporaryFile(suffix='.js', mode='w', delete=False) as script_file:
+                    temp_files.append(script_file.name)
+                    script = f"""
+                    const vscode = require('vscode');
+
+                    async function activateCopilot() {{
+                        try {{
+                            // Open the file
+                            const document = await vscode.workspace.openTextDocument('{escaped_path}');
+                            const editor = await vscode.window.showTextDocument(document);
+                            
+                            // Move cursor to end of file
+                            const lastLine = document.lineCount - 1;
+                            const lastChar = document.lineAt(lastLine).text.length;
+                            editor.selection = new vscode.Selection(lastLine, lastChar, lastLine, lastChar);
+                            
+                            // Trigger Copilot inline suggestion
+                            await vscode.commands.executeCommand('github.copilot.generate');
+                            
+                            // Wait for suggestions
+                            await new Promise(resolve => setTimeout(resolve, 3000));
+                            
+                            // Accept suggestion
+                            await vscode.commands.executeCommand('github.copilot.acceptCurrent');
+                            
+                            // Save the file
+                            await document.save();
+                            
+                            // Exit VS Code
+                            await vscode.commands.executeCommand('workbench.action.closeActiveEditor');
+                            setTimeout(() => vscode.commands.executeCommand('workbench.action.quit'), 500);
+                        }} catch (error) {{
+                            console.error('Error:', error);
+                            vscode.window.showErrorMessage('Error: ' + error.message);
+                            setTimeout(() => vscode.commands.executeCommand('workbench.action.quit'), 1000);
+                        }}
+                    }}
+
+                    activateCopilot();
+                    """
+                    script_file.write(script)
+                    script_file_path = script_file.name
+                    
+                # Run VS Code with the extension script
+                cmd = [
+                    self.vscode_executable_path,
+                    "--extensions-dir", os.path.expanduser("~/.vscode/extensions"),
+                    "--user-data-dir", os.path.expanduser("~/.vscode-copilot-automation"),
+                    "--disable-workspace-trust",
+                    "--extensionDevelopmentPath", os.path.dirname(script_file_path)
+                ]
+                
+                logger.info("Running VS Code in headless mode...")
+                subprocess.run(cmd, check=True, timeout=20)
+                
+                # Read the result
+                return self._read_generated_test(temp_file_path)
+            
+            finally:
+                # Clean up
+                self._remove_temp_files(*temp_files)
+            
+        except Exception as e:
+            logger.error(f"Error in headless mode: {e}")
+            return ""
@@ -0,0 +1,259 @@
+"""
+LLMTestGenerator module for generating tests using LLMs.
+"""
+
+import os
+import re
+import ast
+import logging
+import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from prompt_cache import PromptCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mutation_guided', 'llm_cache.db')
+
+# Generated tests are short methods; this leaves ample room for one
+MAX_TEST_TOKENS = 400
+
+_DEF_LINE_RE = re.compile(r'^([ \t]*)def ', re.M)
+_BLANK_LINES_RE = re.compile(r'\n[ \t]*\n[ \t]*\n')
+# Markdown code fence lines, such as "```python" and the closing "```"
+_FENCE_LINE_RE = re.compile(r'^[ \t]*```.*\n?', re.M)
+
+# Mock responses, in priority order, with the prompt tokens each one requires
+_MOCK_RESPONSES = [
+    ({"calculate_discount", "100"}, '''def test_calculate_discount_boundary_case(self):
+    """Test the boundary case where discount_percent is exactly 100."""
+    # Should fully discount the price (price becomes 0)
+    self.assertEqual(calculator.calculate_discount(100, 100), 0)
+    # Ensure large values still work correctly
+    self.assertEqual(calculator.calculate_discount(500, 100), 0)'''),
+    ({"is_prime", "n <= 1"}, '''def test_is_prime_edge_cases(self):
+    """Test edge cases for the is_prime function."""
+    # n=1 is specifically defined as not prime
+    self.assertFalse(calculator.is_prime(1))
+    # n=0 is not prime
+    self.assertFalse(calculator.is_prime(0))
+    # Negative numbers are not prime
+    self.assertFalse(calculator.is_prime(-5))'''),
+    ({"is_prime", "n % 2 == 0"}, '''def test_is_prime_even_numbers(self):
+    """Test that even numbers greater than 2 are correctly identified as non-prime."""
+    # 2 is prime (the only even prime)
+    self.assertTrue(calculator.is_prime(2))
+    # Test various even numbers, which should all be non-prime
+    self.assertFalse(calculator.is_prime(4))
+    self.assertFalse(calculator.is_prime(6))
+    self.assertFalse(calculator.is_prime(100))'''),
+    ({"is_prime", "return True"}, '''def test_is_prime_larger_numbers(self):
+    """Test that larger prime numbers are correctly identified."""
+    # Test with known larger prime numbers
+    self.assertTrue(calculator.is_prime(17))
+    self.assertTrue(calculator.is_prime(19))
+    self.assertTrue(calculator.is_prime(97))
+    # Test a larger prime number
+    self.assertTrue(calculator.is_prime(7919))'''),
+]
+
+_DEFAULT_MOCK_RESPONSE = '''def test_generated_for_mutant(self):
+    """Test generated to catch a specific mutant."""
+    # This test would be tailored to catch the specific mutation
+    pass'''
+
+# One pass over the prompt finds every token; the lookahead lets overlapping
+# tokens (e.g. "n <= 1" and "100" in "n <= 100") all be reported
+_MOCK_TOKEN_RE = re.compile('(?=(%s))' % '|'.join(
+    re.escape(token)
+    for token in sorted(set().union(*(tokens for tokens, _ in _MOCK_RESPONSES)), key=len, reverse=True)
+))
+
+class LLMTestGenerator:
+    """Generates tests using LLM."""
+    
+    def __init__(self, api_key=None, max_workers: int = 8, cache_path: Optional[str] = DEFAULT_CACHE_PATH):
+        """Initialize with API key if provided.
+        
+        Generated tests are cached on disk by prompt hash at cache_path;
+        pass None to disable the cache.
+        """
+        self.api_key = api_key
+        self.max_workers = max_workers
+        self._client = None
+        self._client_loaded = False
+        self._client_lock = threading.Lock()
+        
+        self._cache = PromptCache(cache_path) if api_key and cache_path else None
+    
+    @property
+    def client(self):
+        """The OpenAI client, created on first use so openai is only imported when needed."""
+        with self._client_lock:
+            if not self._client_loaded:
+                self._client = self._create_client(self.api_key)
+                self._client_loaded = True
+        return self._client
+    
+    @staticmethod
+    def _create_client(api_key: Optional[str]):
+        """Create an OpenAI client for the API key, or None to use mock responses."""
+        if not api_key:
+            return None
+        try:
+            import openai
+        except ImportError:
+            logger.warning("OpenAI package is not installed. Using mock responses instead.")
+            return None
+        return openai.OpenAI(api_key=api_key)
+    
+    def generate_test(self, prompt: str, test_count: int = 1) -> str:
+        """Generate a test method using an LLM.
+        
+        A prompt covering several mutants asks for test_count methods, which
+        are returned together.
+        """
+        try:
+            if self.api_key and self.client:
+                key = PromptCache.key(prompt)
+                cached = self._cache.get(key) if self._cache is not None else None
+                if cached is not None:
+                    logger.info("Using cached LLM response for this prompt")
+                    return cached
+                
+                # Use OpenAI API
+                stream = self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=MAX_TEST_TOKENS * test_count,
+                    temperature=0.5,
+                    top_p=1.0,
+                    frequency_penalty=0.0,
+                    presence_penalty=0.0,
+                    stream=True
+                )
+                test_code = self._read_stream(stream, test_count)
+                # A response that is not valid test code would be served again
+                # on every later run with the same prompt
+                if self._cache is not None and self._is_valid_test(test_code):
+                    self._cache.put(key, test_code)
+                return test_code
+            else:
+                # Mock response for demonstration
+                logger.warning("No API key provided. Using mock LLM responses.")
+                return self._mock_response(prompt, test_count)
+        except Exception as e:
+            logger.error(f"Error generating test with LLM: {e}")
+            return ""
+    
+    @staticmethod
+    def _is_valid_test(test_code: str) -> bool:
+        """Return whether test_code parses and defines at least one test method."""
+        try:
+            tree = ast.parse(test_code)
+        except SyntaxError:
+            return False
+        return any(isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) for node in tree.body)
+    
+    @staticmethod
+    def _complete_tests(text: str, test_count: int = 1) -> Optional[str]:
+        """Return the first test_count test methods in text if they are complete, else None.
+        
+        The last of them is complete once it is followed by two blank lines,
+        a closing code fence or another def at the same indentation. Any
+        preamble before the first def and code fence lines are left out;
+        methods written inside a class are dedented as a whole, keeping their
+        relative indentation.
+        """
+        first_def = _DEF_LINE_RE.search(text)
+        if first_def is None:
+            return None
+        
+        last_def = first_def
+        next_def = None
+        methods_seen = 1
+        for match in _DEF_LINE_RE.finditer(text, first_def.end()):
+            if match.group(1) != first_def.group(1):
+                continue
+            if methods_seen == test_count:
+                next_def = match
+                break
+            last_def = match
+            methods_seen += 1
+        if methods_seen < test_count:
+            return None
+        
+        ends = [next_def] if next_def else []
+        ends += filter(None, (_BLANK_LINES_RE.search(text, last_def.end()),
+                              _FENCE_LINE_RE.search(text, last_def.end())))
+        if not ends:
+            return None
+        return LLMTestGenerator._extract_tests(text, first_def.start(), min(match.start() for match in ends))
+    
+    @staticmethod
+    def _extract_tests(text: str, start: int, end: Optional[int] = None) -> str:
+        """Return text[start:end] without code fence lines, dedented as a whole."""
+        return textwrap.dedent(_FENCE_LINE_RE.sub('', text[start:end])).strip()
+    
+    @staticmethod
+    def _read_stream(stream, test_count: int = 1) -> str:
+        """Accumulate a streamed completion, stopping once test_count test methods are complete."""
+        text = ""
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                text += delta
+                if '\n' in delta:
+                    complete_tests = LLMTestGenerator._complete_tests(text, test_count)
+                    if complete_tests is not None:
+                        return complete_tests
+        finally:
+            # Stops the transfer early when we return before the stream ends
+            stream.close()
+        # The stream ended before test_count methods were complete; keep the
+        # methods it has, up to any closing code fence
+        first_def = _DEF_LINE_RE.search(text)
+        if first_def is None:
+            return ""
+        fence = _FENCE_LINE_RE.search(text, first_def.end())
+        return LLMTestGenerator._extract_tests(text, first_def.start(), fence.start() if fence else None)
+    
+    def generate_tests_batch(self, prompts: List[str], test_counts: Optional[List[int]] = None) -> List[str]:
+        """Generate test methods for several prompts concurrently, preserving order.
+        
+        test_counts gives the number of test methods each prompt asks for
+        (one each by default).
+        """
+        if not prompts:
+            return []
+        if test_counts is None:
+            test_counts = [1] * len(prompts)
+        
+        # Prompts that hash alike get the same test, so request each only once;
+        # concurrent duplicates would all miss the cache
+        keys = [PromptCache.key(prompt) for prompt in prompts]
+        unique_requests = {}
+        for key, prompt, test_count in zip(keys, prompts, test_counts):
+            unique_requests.setdefault(key, (prompt, test_count))
+        unique_prompts = [prompt for prompt, _ in unique_requests.values()]
+        unique_counts = [test_count for _, test_count in unique_requests.values()]
+        
+        # Each request is network-bound, so threads overlap the round-trips
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique_requests))) as executor:
+            tests = dict(zip(unique_requests, executor.map(self.generate_test, unique_prompts, unique_counts)))
+        return [tests[key] for key in keys]
+    
+    def _mock_response(self, prompt: str, test_count: int = 1) -> str:
+        """Provide mock responses for demonstration purposes."""
+        matched_tokens = {match.group(1) for match in _MOCK_TOKEN_RE.finditer(prompt)}
+        responses = [
+            response for required_tokens, response in _MOCK_RESPONSES
+            if required_tokens <= matched_tokens
+        ]
+        return '\n\n'.join(responses[:test_count]) or _DEFAULT_MOCK_RESPONSE
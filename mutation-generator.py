@@ -77,7 +77,7 @@ class MutationGuidedTestGenerator:
             # Step 3 & 4: Generate LLM prompts and new tests
             new_tests = []
             for mutant in mutants:
-                logger.info(f"Processing mutant: {mutant['description']}")
+                logger.debug("Processing mutant: %s", mutant['description'])
                 
                 # Create LLM prompt based on the mutant
                 prompt = CodeAnalyzer.create_prompt_for_mutant(
@@ -106,7 +106,7 @@ class MutationGuidedTestGenerator:
                 logger.info(f"Updated test file: {test_file}")
                 
                 # Step 6: Verify the effectiveness of new tests
-                verification = TestRunner.verify_tests(
+                _, verification = TestRunner.verify_tests(
                     source_file, test_file
                 )
                 logger.info(f"Verification result: {verification}")
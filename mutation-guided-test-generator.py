@@ -7,13 +7,24 @@ A tool that enhances test suites using mutation testing and LLM-guided test gene
 import os
 import re
 import sys
-import subprocess
+import json
+import hashlib
+import shutil
+import tempfile
+import textwrap
+import threading
 import ast
 import argparse
-import glob
-from typing import List, Dict, Tuple, Any, Optional
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Tuple, Any, Optional
 import logging
-import openai  # For LLM integration
+
+from mutation_tester import MutationTester, MutationTestingError, SourceNotExecutedError
+from prompt_cache import PromptCache
+from test_runner import TestRunner
 
 # Configure logging
 logging.basicConfig(
@@ -23,32 +34,149 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_SKIPPED_DIRS = {'__pycache__', 'venv', 'node_modules', 'build', 'dist'}
+
+# Contents returned by read_file, keyed by path and validated by (mtime_ns, size)
+_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+_TEST_CLASS_RE = re.compile(r'\s*class\s+Test\w*')
+
+
+def _scan_last_test_class_end(lines: List[str]) -> Optional[int]:
+    """Find the last line of the last top-level Test* class with a line scan.
+    
+    Returns None when the layout is ambiguous without a real parse, e.g. a
+    multi-line string or a continuation line that reaches column 0.
+    """
+    class_start = None
+    for i, line in enumerate(lines):
+        if _TEST_CLASS_RE.match(line):
+            class_start = i
+    if class_start is None or lines[class_start][0].isspace():
+        return None
+    
+    end_line = class_start + 1
+    depth = 0
+    for i in range(class_start, len(lines)):
+        line = lines[i]
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        if i > class_start and not line[0].isspace():
+            if depth:
+                return None
+            break
+        if line.count('"""') % 2 or line.count("'''") % 2 or stripped.endswith('\\'):
+            return None
+        depth += sum(map(line.count, '([{')) - sum(map(line.count, ')]}'))
+        end_line = i + 1
+    return end_line
+
+
+def _parse_last_test_class_end(content: str) -> int:
+    """Find the last line of the last Test* class using the AST."""
+    last_class_line = 0
+    pending = list(ast.parse(content).body)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ast.ClassDef) and node.name.startswith('Test'):
+            # Anything nested in this class ends within it
+            last_class_line = max(last_class_line, node.end_lineno)
+            continue
+        # Classes are statements, so expression subtrees never hold one
+        pending.extend(child for child in ast.iter_child_nodes(node)
+                       if not isinstance(child, ast.expr))
+    return last_class_line
+
+
+def _indent_test_block(test: str, indent: str) -> Optional[str]:
+    """Re-indent a generated test block for a class body, or None if it is not valid there.
+    
+    Blocks may arrive at column 0 or already indented for a class, so their
+    common indentation is removed before adding the class indentation.
+    """
+    block = textwrap.indent(textwrap.dedent(test).strip(), indent)
+    try:
+        ast.parse(f"class _GeneratedTests:\n{block}\n")
+    except SyntaxError:
+        return None
+    return block
+
+
 class FileSystem:
     """Handles file system operations."""
     
     @staticmethod
     def list_python_files(directory: str) -> List[str]:
         """List all Python files in a directory recursively."""
-        if not os.path.exists(directory):
-            return []
-        
-        return glob.glob(os.path.join(directory, "**/*.py"), recursive=True)
+        python_files = []
+        pending = [directory]
+        while pending:
+            # Missing, unreadable or non-directory paths hold no files to list
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    # Hidden entries are skipped, as glob would skip them
+                    if entry.name.startswith('.'):
+                        continue
+                    # DirEntry caches the file type, so these checks need no extra stat
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIPPED_DIRS:
+                            pending.append(entry.path)
+                    elif entry.name.endswith('.py'):
+                        python_files.append(entry.path)
+        return python_files
     
     @staticmethod
     def read_file(file_path: str) -> str:
-        """Read the contents of a file."""
+        """Read the contents of a file, reusing the previous read if it is unchanged."""
+        stat = os.stat(file_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _FILE_CACHE.get(file_path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        
         with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
+            content = f.read()
+        _FILE_CACHE[file_path] = (signature, content)
+        return content
+    
+    @staticmethod
+    def hash_files(*file_paths: str) -> str:
+        """Return a SHA-256 digest over the contents of the given files."""
+        digest = hashlib.sha256()
+        for i, file_path in enumerate(file_paths):
+            if i:
+                digest.update(b'\0')
+            with open(file_path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
     
     @staticmethod
     def write_file(file_path: str, content: str) -> bool:
-        """Write content to a file."""
+        """Write content to a file atomically, so no reader sees it half-written."""
+        _FILE_CACHE.pop(file_path, None)
+        temp_path = f"{file_path}.tmp-{os.getpid()}"
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
+            with open(temp_path, 'w', encoding='utf-8') as f:
                 f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                shutil.copymode(file_path, temp_path)
+            except FileNotFoundError:
+                pass
+            os.replace(temp_path, file_path)
             return True
         except Exception as e:
             logger.error(f"Error writing to file {file_path}: {e}")
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
             return False
     
     @staticmethod
@@ -57,295 +185,387 @@ class FileSystem:
         try:
             content = FileSystem.read_file(test_file)
             
-            # Parse the test file to find the test class
-            tree = ast.parse(content)
+            # Split the content into lines
+            lines = content.split('\n')
             
-            # Find the last line of the last test class
-            last_class_line = 0
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and node.name.startswith('Test'):
-                    if hasattr(node, 'end_lineno'):
-                        last_class_line = max(last_class_line, node.end_lineno)
+            # Find the last line of the last test class, parsing only if the scan is unsure
+            last_class_line = _scan_last_test_class_end(lines)
+            if last_class_line is None:
+                last_class_line = _parse_last_test_class_end(content)
             
             if last_class_line == 0:
                 # No test class found, can't update
                 logger.error(f"No test class found in {test_file}")
                 return False
             
-            # Split the content into lines
-            lines = content.split('\n')
-            
-            # Find the line to insert new tests
-            insert_line = last_class_line
-            for i in range(last_class_line - 1, 0, -1):
-                if i >= len(lines):
-                    continue
-                if lines[i].strip() == '' or 'if __name__' in lines[i]:
-                    insert_line = i
-                    break
-            
-            # Insert the new tests
+            # Insert the new tests right after the class's last line, which keeps
+            # them ahead of anything following the class, such as an
+            # "if __name__" guard. The original text is sliced around them
+            # rather than re-joining its lines, and all fragments are joined
+            # once at the end.
+            class_end = sum(map(len, lines[:last_class_line])) + last_class_line - 1
             indent = '    '  # Assuming 4-space indentation
-            new_content = '\n'.join(lines[:insert_line])
+            parts = [content[:class_end]]
             
             for test in new_tests:
                 # Make sure the test is properly indented
-                indented_test = '\n'.join([indent + line for line in test.strip().split('\n')])
-                new_content += f"\n\n{indented_test}"
+                block = _indent_test_block(test, indent)
+                if block is None:
+                    logger.warning(f"Skipping generated test that is not valid Python:\n{test}")
+                    continue
+                parts.append(block)
+            
+            if len(parts) == 1:
+                logger.error(f"No valid tests to add to {test_file}")
+                return False
             
-            if insert_line < len(lines):
-                new_content += '\n\n' + '\n'.join(lines[insert_line:])
+            # Never write a test file that no longer parses
+            updated_content = '\n\n'.join(parts) + (content[class_end:] or '\n')
+            try:
+                ast.parse(updated_content)
+            except SyntaxError as e:
+                logger.error(f"Adding the generated tests would break {test_file}: {e}")
+                return False
             
             # Write the updated content back
-            return FileSystem.write_file(test_file, new_content)
+            return FileSystem.write_file(test_file, updated_content)
             
         except Exception as e:
             logger.error(f"Error updating test file: {e}")
             return False
 
 
-class MutationTester:
-    """Runs mutation testing using MutMut."""
-    
-    @staticmethod
-    def ensure_mutmut_installed() -> bool:
-        """Ensure MutMut is installed."""
-        try:
-            subprocess.run([sys.executable, '-m', 'pip', 'install', 'mutmut'], 
-                          check=True, 
-                          stdout=subprocess.PIPE, 
-                          stderr=subprocess.PIPE)
-            return True
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to install MutMut: {e}")
-            return False
-    
-    @staticmethod
-    def run_mutation_testing(source_file: str, test_file: str) -> List[Dict[str, Any]]:
-        """Run mutation testing using MutMut and return surviving mutants."""
-        if not MutationTester.ensure_mutmut_installed():
-            return []
-        
-        try:
-            # Run mutmut on the source file
-            logger.info(f"Running mutation testing on {source_file}")
-            cmd = [
-                'mutmut', 'run', 
-                f'--paths-to-mutate={source_file}',
-                f'--test-dir={os.path.dirname(test_file)}'
-            ]
-            
-            result = subprocess.run(
-                cmd, 
-                capture_output=True,
-                text=True
-            )
-            
-            # Parse the output to find surviving mutants
-            surviving_mutants = []
-            
-            # Get the list of surviving mutants
-            list_cmd = ['mutmut', 'results']
-            list_result = subprocess.run(
-                list_cmd,
-                capture_output=True,
-                text=True
-            )
-            
-            # Parse the results to extract mutant IDs
-            mutant_ids = []
-            for line in list_result.stdout.splitlines():
-                # Look for lines with surviving mutant IDs
-                if 'SURVIVED' in line:
-                    try:
-                        mutant_id = line.split(':')[0].strip()
-                        if mutant_id.isdigit():
-                            mutant_ids.append(mutant_id)
-                    except Exception:
-                        continue
-            
-            # Get details for each surviving mutant
-            for mutant_id in mutant_ids:
-                show_cmd = ['mutmut', 'show', mutant_id]
-                show_result = subprocess.run(
-                    show_cmd,
-                    capture_output=True,
-                    text=True
-                )
-                
-                # Parse the diff to understand the mutation
-                diff_lines = show_result.stdout.splitlines()
-                original_line = ""
-                mutated_line = ""
-                line_number = 0
-                
-                for i, line in enumerate(diff_lines):
-                    if line.startswith('--- '):
-                        # Extract file and line information
-                        file_info = line
-                        continue
-                    if line.startswith('@@'):
-                        # Extract line number
-                        line_info = line
-                        match = re.search(r'@@ -(\d+)', line)
-                        if match:
-                            line_number = int(match.group(1))
-                        continue
-                    if line.startswith('-') and not line.startswith('--- '):
-                        original_line = line[1:].strip()
-                    if line.startswith('+') and not line.startswith('+++ '):
-                        mutated_line = line[1:].strip()
-                
-                if original_line and mutated_line:
-                    surviving_mutants.append({
-                        'id': mutant_id,
-                        'line_number': line_number,
-                        'original_line': original_line,
-                        'mutated_line': mutated_line,
-                        'description': f"Changed '{original_line}' to '{mutated_line}' at line {line_number}"
-                    })
-            
-            logger.info(f"Found {len(surviving_mutants)} surviving mutants")
-            return surviving_mutants
-            
-        except Exception as e:
-            logger.error(f"Error running mutation testing: {e}")
-            return []
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mutation_guided', 'llm_cache.db')
 
+# Generated tests are short methods; this leaves ample room for one
+MAX_TEST_TOKENS = 400
 
-class LLMTestGenerator:
-    """Generates tests using LLM."""
-    
-    def __init__(self, api_key=None):
-        """Initialize with API key if provided."""
-        self.api_key = api_key
-        if api_key:
-            openai.api_key = api_key
-    
-    def generate_test(self, prompt: str) -> str:
-        """Generate a test method using an LLM."""
-        try:
-            if self.api_key:
-                # Use OpenAI API
-                response = openai.Completion.create(
-                    engine="gpt-4",
-                    prompt=prompt,
-                    max_tokens=1000,
-                    temperature=0.5,
-                    top_p=1.0,
-                    frequency_penalty=0.0,
-                    presence_penalty=0.0
-                )
-                return response.choices[0].text.strip()
-            else:
-                # Mock response for demonstration
-                logger.warning("No API key provided. Using mock LLM responses.")
-                return self._mock_response(prompt)
-        except Exception as e:
-            logger.error(f"Error generating test with LLM: {e}")
-            return ""
-    
-    def _mock_response(self, prompt: str) -> str:
-        """Provide mock responses for demonstration purposes."""
-        if "calculate_discount" in prompt and "100" in prompt:
-            return """def test_calculate_discount_boundary_case(self):
+_DEF_LINE_RE = re.compile(r'^([ \t]*)def ', re.M)
+_BLANK_LINES_RE = re.compile(r'\n[ \t]*\n[ \t]*\n')
+# Markdown code fence lines, such as "```python" and the closing "```"
+_FENCE_LINE_RE = re.compile(r'^[ \t]*```.*\n?', re.M)
+
+# Mock responses, in priority order, with the prompt tokens each one requires
+_MOCK_RESPONSES = [
+    ({"calculate_discount", "100"}, '''def test_calculate_discount_boundary_case(self):
     """Test the boundary case where discount_percent is exactly 100."""
     # Should fully discount the price (price becomes 0)
     self.assertEqual(calculator.calculate_discount(100, 100), 0)
     # Ensure large values still work correctly
-    self.assertEqual(calculator.calculate_discount(500, 100), 0)"""
-            
-        elif "is_prime" in prompt and "n <= 1" in prompt:
-            return """def test_is_prime_edge_cases(self):
+    self.assertEqual(calculator.calculate_discount(500, 100), 0)'''),
+    ({"is_prime", "n <= 1"}, '''def test_is_prime_edge_cases(self):
     """Test edge cases for the is_prime function."""
     # n=1 is specifically defined as not prime
     self.assertFalse(calculator.is_prime(1))
     # n=0 is not prime
     self.assertFalse(calculator.is_prime(0))
     # Negative numbers are not prime
-    self.assertFalse(calculator.is_prime(-5))"""
-            
-        elif "is_prime" in prompt and "n % 2 == 0" in prompt:
-            return """def test_is_prime_even_numbers(self):
+    self.assertFalse(calculator.is_prime(-5))'''),
+    ({"is_prime", "n % 2 == 0"}, '''def test_is_prime_even_numbers(self):
     """Test that even numbers greater than 2 are correctly identified as non-prime."""
     # 2 is prime (the only even prime)
     self.assertTrue(calculator.is_prime(2))
     # Test various even numbers, which should all be non-prime
     self.assertFalse(calculator.is_prime(4))
     self.assertFalse(calculator.is_prime(6))
-    self.assertFalse(calculator.is_prime(100))"""
-            
-        elif "is_prime" in prompt and "return True" in prompt:
-            return """def test_is_prime_larger_numbers(self):
+    self.assertFalse(calculator.is_prime(100))'''),
+    ({"is_prime", "return True"}, '''def test_is_prime_larger_numbers(self):
     """Test that larger prime numbers are correctly identified."""
     # Test with known larger prime numbers
     self.assertTrue(calculator.is_prime(17))
     self.assertTrue(calculator.is_prime(19))
     self.assertTrue(calculator.is_prime(97))
     # Test a larger prime number
-    self.assertTrue(calculator.is_prime(7919))"""
-            
-        else:
-            return """def test_generated_for_mutant(self):
+    self.assertTrue(calculator.is_prime(7919))'''),
+]
+
+_DEFAULT_MOCK_RESPONSE = '''def test_generated_for_mutant(self):
     """Test generated to catch a specific mutant."""
     # This test would be tailored to catch the specific mutation
-    pass"""
+    pass'''
+
+# One pass over the prompt finds every token; the lookahead lets overlapping
+# tokens (e.g. "n <= 1" and "100" in "n <= 100") all be reported
+_MOCK_TOKEN_RE = re.compile('(?=(%s))' % '|'.join(
+    re.escape(token)
+    for token in sorted(set().union(*(tokens for tokens, _ in _MOCK_RESPONSES)), key=len, reverse=True)
+))
 
 
-class TestRunner:
-    """Runs tests and verifies their effectiveness."""
+class LLMTestGenerator:
+    """Generates tests using LLM."""
+    
+    def __init__(self, api_key=None, max_workers: int = 8, cache_path: Optional[str] = DEFAULT_CACHE_PATH):
+        """Initialize with API key if provided.
+        
+        Generated tests are cached on disk by prompt hash at cache_path;
+        pass None to disable the cache.
+        """
+        self.api_key = api_key
+        self.max_workers = max_workers
+        self._client = None
+        self._client_loaded = False
+        self._client_lock = threading.Lock()
+        
+        self._cache = PromptCache(cache_path) if api_key and cache_path else None
+    
+    @property
+    def client(self):
+        """The OpenAI client, created on first use so openai is only imported when needed."""
+        with self._client_lock:
+            if not self._client_loaded:
+                self._client = self._create_client(self.api_key)
+                self._client_loaded = True
+        return self._client
     
     @staticmethod
-    def verify_tests(source_file: str, test_file: str) -> str:
-        """Run tests to verify they're working and killing mutants."""
+    def _create_client(api_key: Optional[str]):
+        """Create an OpenAI client for the API key, or None to use mock responses."""
+        if not api_key:
+            return None
         try:
-            # Run the tests
-            test_dir = os.path.dirname(test_file)
-            test_module = os.path.basename(test_file)[:-3]  # Remove .py
-            
-            logger.info(f"Running tests in {test_file}")
-            cmd = [sys.executable, '-m', 'unittest', f'{test_module}']
-            result = subprocess.run(
-                cmd,
-                cwd=test_dir,
-                capture_output=True,
-                text=True
-            )
-            
-            if result.returncode != 0:
-                error_msg = f"Tests failed to run: {result.stderr}"
-                logger.error(error_msg)
-                return error_msg
-            
-            # Run mutation testing again to see if mutants are now killed
-            logger.info("Running mutation testing again to verify improvement")
-            cmd = [
-                'mutmut', 'run', 
-                f'--paths-to-mutate={source_file}',
-                f'--test-dir={os.path.dirname(test_file)}'
-            ]
-            
-            result = subprocess.run(
-                cmd, 
-                capture_output=True,
-                text=True
-            )
-            
-            # Parse the output for mutation score
-            mutation_score = "Unknown"
-            for line in result.stdout.splitlines():
-                if "Mutation score" in line:
-                    mutation_score = line.strip()
-                    break
-            
-            success_msg = f"Tests passed. {mutation_score}"
-            logger.info(success_msg)
-            return success_msg
-            
+            import openai
+        except ImportError:
+            logger.warning("OpenAI package is not installed. Using mock responses instead.")
+            return None
+        return openai.OpenAI(api_key=api_key)
+    
+    def generate_test(self, prompt: str, test_count: int = 1) -> str:
+        """Generate a test method using an LLM.
+        
+        A prompt covering several mutants asks for test_count methods, which
+        are returned together.
+        """
+        try:
+            if self.api_key and self.client:
+                key = PromptCache.key(prompt)
+                cached = self._cache.get(key) if self._cache is not None else None
+                if cached is not None:
+                    logger.info("Using cached LLM response for this prompt")
+                    return cached
+                
+                # Use OpenAI API
+                stream = self.client.chat.completions.create(
+                    model="gpt-4",
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=MAX_TEST_TOKENS * test_count,
+                    temperature=0.5,
+                    top_p=1.0,
+                    frequency_penalty=0.0,
+                    presence_penalty=0.0,
+                    stream=True
+                )
+                test_code = self._read_stream(stream, test_count)
+                # A response that is not valid test code would be served again
+                # on every later run with the same prompt
+                if self._cache is not None and self._is_valid_test(test_code):
+                    self._cache.put(key, test_code)
+                return test_code
+            else:
+                # Mock response for demonstration
+                logger.warning("No API key provided. Using mock LLM responses.")
+                return self._mock_response(prompt, test_count)
         except Exception as e:
-            error_msg = f"Error verifying tests: {e}"
-            logger.error(error_msg)
-            return error_msg
+            logger.error(f"Error generating test with LLM: {e}")
+            return ""
+    
+    @staticmethod
+    def _is_valid_test(test_code: str) -> bool:
+        """Return whether test_code parses and defines at least one test method."""
+        try:
+            tree = ast.parse(test_code)
+        except SyntaxError:
+            return False
+        return any(isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) for node in tree.body)
+    
+    @staticmethod
+    def _complete_tests(text: str, test_count: int = 1) -> Optional[str]:
+        """Return the first test_count test methods in text if they are complete, else None.
+        
+        The last of them is complete once it is followed by two blank lines,
+        a closing code fence or another def at the same indentation. Any
+        preamble before the first def and code fence lines are left out;
+        methods written inside a class are dedented as a whole, keeping their
+        relative indentation.
+        """
+        first_def = _DEF_LINE_RE.search(text)
+        if first_def is None:
+            return None
+        
+        last_def = first_def
+        next_def = None
+        methods_seen = 1
+        for match in _DEF_LINE_RE.finditer(text, first_def.end()):
+            if match.group(1) != first_def.group(1):
+                continue
+            if methods_seen == test_count:
+                next_def = match
+                break
+            last_def = match
+            methods_seen += 1
+        if methods_seen < test_count:
+            return None
+        
+        ends = [next_def] if next_def else []
+        ends += filter(None, (_BLANK_LINES_RE.search(text, last_def.end()),
+                              _FENCE_LINE_RE.search(text, last_def.end())))
+        if not ends:
+            return None
+        return LLMTestGenerator._extract_tests(text, first_def.start(), min(match.start() for match in ends))
+    
+    @staticmethod
+    def _extract_tests(text: str, start: int, end: Optional[int] = None) -> str:
+        """Return text[start:end] without code fence lines, dedented as a whole."""
+        return textwrap.dedent(_FENCE_LINE_RE.sub('', text[start:end])).strip()
+    
+    @staticmethod
+    def _read_stream(stream, test_count: int = 1) -> str:
+        """Accumulate a streamed completion, stopping once test_count test methods are complete."""
+        text = ""
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                text += delta
+                if '\n' in delta:
+                    complete_tests = LLMTestGenerator._complete_tests(text, test_count)
+                    if complete_tests is not None:
+                        return complete_tests
+        finally:
+            # Stops the transfer early when we return before the stream ends
+            stream.close()
+        # The stream ended before test_count methods were complete; keep the
+        # methods it has, up to any closing code fence
+        first_def = _DEF_LINE_RE.search(text)
+        if first_def is None:
+            return ""
+        fence = _FENCE_LINE_RE.search(text, first_def.end())
+        return LLMTestGenerator._extract_tests(text, first_def.start(), fence.start() if fence else None)
+    
+    def generate_tests_batch(self, prompts: List[str], test_counts: Optional[List[int]] = None) -> List[str]:
+        """Generate test methods for several prompts concurrently, preserving order.
+        
+        test_counts gives the number of test methods each prompt asks for
+        (one each by default).
+        """
+        if not prompts:
+            return []
+        if test_counts is None:
+            test_counts = [1] * len(prompts)
+        
+        # Prompts that hash alike get the same test, so request each only once;
+        # concurrent duplicates would all miss the cache
+        keys = [PromptCache.key(prompt) for prompt in prompts]
+        unique_requests = {}
+        for key, prompt, test_count in zip(keys, prompts, test_counts):
+            unique_requests.setdefault(key, (prompt, test_count))
+        unique_prompts = [prompt for prompt, _ in unique_requests.values()]
+        unique_counts = [test_count for _, test_count in unique_requests.values()]
+        
+        # Each request is network-bound, so threads overlap the round-trips
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique_requests))) as executor:
+            tests = dict(zip(unique_requests, executor.map(self.generate_test, unique_prompts, unique_counts)))
+        return [tests[key] for key in keys]
+    
+    def _mock_response(self, prompt: str, test_count: int = 1) -> str:
+        """Provide mock responses for demonstration purposes."""
+        matched_tokens = {match.group(1) for match in _MOCK_TOKEN_RE.finditer(prompt)}
+        responses = [
+            response for required_tokens, response in _MOCK_RESPONSES
+            if required_tokens <= matched_tokens
+        ]
+        return '\n\n'.join(responses[:test_count]) or _DEFAULT_MOCK_RESPONSE
+
+
+_DEF_RE = re.compile(r'def\s+(\w+)\s*\(')
+
+
+@lru_cache(maxsize=64)
+def _parse_file(file_path: str, mtime_ns: int, size: int) -> Tuple[str, List[str], ast.Module]:
+    """Read and parse a file once per (path, mtime, size)."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    return content, content.splitlines(), ast.parse(content)
+
+
+def _load(file_path: str) -> Tuple[str, List[str], ast.Module]:
+    """Return (content, lines, tree) for a file, re-parsing only when it changes."""
+    # The size catches rewrites that land within the filesystem's mtime resolution
+    stat = os.stat(file_path)
+    return _parse_file(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+class _FunctionDefCollector(ast.NodeVisitor):
+    """Collect FunctionDef nodes, descending through statements only.
+    
+    Function definitions can never appear inside an expression, so skipping
+    expression subtrees (calls, literals, comprehensions, ...) visits far
+    fewer nodes than ast.walk without missing any.
+    """
+    
+    def __init__(self, nested: bool):
+        self.nested = nested
+        self.functions: List[ast.FunctionDef] = []
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        self.functions.append(node)
+        if self.nested:
+            self.generic_visit(node)
+    
+    def generic_visit(self, node: ast.AST) -> None:
+        for child in ast.iter_child_nodes(node):
+            if not isinstance(child, ast.expr):
+                self.visit(child)
+
+
+def _collect_functions(tree: ast.Module, nested: bool) -> List[ast.FunctionDef]:
+    """Return the functions of a module, optionally including nested ones."""
+    collector = _FunctionDefCollector(nested)
+    collector.visit(tree)
+    return collector.functions
+
+
+@lru_cache(maxsize=64)
+def _function_index(tree: ast.Module) -> Tuple[List[int], List[ast.FunctionDef]]:
+    """Index the outermost functions of a module by their first line."""
+    # Nested functions are part of their outer one, so ranges never overlap
+    functions = sorted(_collect_functions(tree, nested=False), key=lambda node: node.lineno)
+    return [node.lineno for node in functions], functions
+
+
+def _find_function(tree: ast.Module, line_number: int) -> Optional[ast.FunctionDef]:
+    """Return the outermost function containing the given line, if any."""
+    starts, functions = _function_index(tree)
+    i = bisect_right(starts, line_number) - 1
+    if i >= 0 and functions[i].end_lineno >= line_number:
+        return functions[i]
+    return None
+
+
+@lru_cache(maxsize=64)
+def _tests_by_target(tree: ast.Module) -> Dict[str, List[Tuple[int, int]]]:
+    """Map each candidate target-function name to the (lineno, end_lineno) of its tests.
+    
+    test_calculate_discount_boundary is filed under every run of words in its
+    name (calculate, calculate_discount, discount_boundary, ...), so a
+    function name is looked up directly instead of scanning every test.
+    """
+    tests_by_target = {}
+    for node in _collect_functions(tree, nested=True):
+        if not node.name.startswith('test_'):
+            continue
+        tokens = node.name[5:].lower().split('_')
+        targets = {
+            '_'.join(tokens[start:end])
+            for start in range(len(tokens))
+            for end in range(start + 1, len(tokens) + 1)
+        }
+        for target in targets:
+            tests_by_target.setdefault(target, []).append((node.lineno, node.end_lineno))
+    return tests_by_target
 
 
 class CodeAnalyzer:
@@ -363,56 +583,50 @@ class CodeAnalyzer:
             
             # Handle common naming patterns
             if test_name.startswith('test_'):
-                source_name = test_name[5:]  # Remove 'test_'
-                if source_name in source_base_names:
-                    mapping[source_base_names[source_name]] = test_file
+                source_name = test_name.removeprefix('test_')
             elif test_name.endswith('_test'):
-                source_name = test_name[:-5]  # Remove '_test'
-                if source_name in source_base_names:
-                    mapping[source_base_names[source_name]] = test_file
+                source_name = test_name.removesuffix('_test')
+            else:
+                source_name = None
             
-            # If no match found by naming convention, try to infer from content
-            if len(mapping) == 0:
-                # This would require more sophisticated analysis in a production tool
-                pass
+            if source_name in source_base_names:
+                mapping[source_base_names[source_name]] = test_file
         
         return mapping
     
     @staticmethod
-    def create_prompt_for_mutant(source_file: str, test_file: str, mutant: Dict[str, Any]) -> str:
-        """Create a prompt for the LLM to generate a test for the given mutant."""
-        # Read the source file to extract the relevant function
-        with open(source_file, 'r', encoding='utf-8') as f:
-            source_content = f.read()
+    def warm_cache(*file_paths: str) -> None:
+        """Read and parse the given files ahead of prompt creation."""
+        for file_path in file_paths:
+            _load(file_path)
+    
+    @staticmethod
+    def _function_context(source_file: str, test_file: str, line_number: int) -> Tuple[str, Optional[str], str]:
+        """Return (module_name, function_code, existing_tests) around a source line."""
+        # Load the source file to extract the relevant function
+        _, source_lines, tree = _load(source_file)
         
-        # Read the test file to extract existing tests
-        with open(test_file, 'r', encoding='utf-8') as f:
-            test_content = f.read()
+        # Load the test file to extract existing tests
+        _, test_lines, test_tree = _load(test_file)
         
-        # Parse the source file to find the function containing the mutation
-        tree = ast.parse(source_content)
+        # Find the function containing the mutation
         function_name = None
         function_code = None
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                if hasattr(node, 'lineno') and hasattr(node, 'end_lineno'):
-                    if node.lineno <= mutant['line_number'] <= node.end_lineno:
-                        function_name = node.name
-                        function_code = source_content.splitlines()[node.lineno-1:node.end_lineno]
-                        function_code = '\n'.join(function_code)
-                        break
+        node = _find_function(tree, line_number)
+        if node is not None:
+            function_name = node.name
+            function_code = '\n'.join(source_lines[node.lineno-1:node.end_lineno])
         
         if not function_name or not function_code:
             # If we couldn't find the function, use a more generic approach
             # Extract a few lines around the mutation
-            lines = source_content.splitlines()
-            start_line = max(0, mutant['line_number'] - 5)
-            end_line = min(len(lines), mutant['line_number'] + 5)
-            context_code = '\n'.join(lines[start_line:end_line])
+            start_line = max(0, line_number - 5)
+            end_line = min(len(source_lines), line_number + 5)
+            context_code = '\n'.join(source_lines[start_line:end_line])
             
             # Try to extract the function name from the context
-            match = re.search(r'def\s+(\w+)\s*\(', context_code)
+            match = _DEF_RE.search(context_code) if 'def' in context_code else None
             if match:
                 function_name = match.group(1)
             else:
@@ -420,16 +634,33 @@ class CodeAnalyzer:
         
         # Extract existing tests for this function
         existing_tests = ""
-        test_tree = ast.parse(test_content)
-        for node in ast.walk(test_tree):
-            if isinstance(node, ast.FunctionDef):
-                if node.name.startswith('test_') and function_name.lower() in node.name.lower():
-                    test_code = test_content.splitlines()[node.lineno-1:node.end_lineno]
-                    existing_tests += '\n'.join(test_code) + '\n\n'
+        for lineno, end_lineno in _tests_by_target(test_tree).get(function_name.lower(), []):
+            existing_tests += '\n'.join(test_lines[lineno-1:end_lineno]) + '\n\n'
         
-        # Create the prompt
         module_name = os.path.splitext(os.path.basename(source_file))[0]
+        return module_name, function_code, existing_tests
+    
+    @staticmethod
+    def group_mutants_by_function(source_file: str, mutants: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Group mutants by the function containing them, in order of first appearance.
         
+        Mutants outside any function each form a group of their own.
+        """
+        _, _, tree = _load(source_file)
+        groups = {}
+        for i, mutant in enumerate(mutants):
+            node = _find_function(tree, mutant['line_number'])
+            groups.setdefault(node if node is not None else i, []).append(mutant)
+        return list(groups.values())
+    
+    @staticmethod
+    def create_prompt_for_mutant(source_file: str, test_file: str, mutant: Dict[str, Any]) -> str:
+        """Create a prompt for the LLM to generate a test for the given mutant."""
+        module_name, function_code, existing_tests = CodeAnalyzer._function_context(
+            source_file, test_file, mutant['line_number']
+        )
+        
+        # Create the prompt
         prompt = f"""
 I have a function in module '{module_name}':
 
@@ -447,15 +678,247 @@ Return only the Python code for the test method, properly indented and with docs
 """
         
         return prompt
+    
+    @staticmethod
+    def create_prompt_for_mutants(source_file: str, test_file: str, mutants: List[Dict[str, Any]]) -> str:
+        """Create one prompt asking for a test per mutant, for mutants in the same function.
+        
+        The function and its existing tests are sent once for the whole group
+        instead of once per mutant.
+        """
+        if len(mutants) == 1:
+            return CodeAnalyzer.create_prompt_for_mutant(source_file, test_file, mutants[0])
+        
+        module_name, function_code, existing_tests = CodeAnalyzer._function_context(
+            source_file, test_file, mutants[0]['line_number']
+        )
+        changes = '\n'.join(
+            f"{i}. Changing '{mutant['original_line']}' to '{mutant['mutated_line']}' at line {mutant['line_number']}"
+            for i, mutant in enumerate(mutants, 1)
+        )
+        
+        # Create the prompt
+        prompt = f"""
+I have a function in module '{module_name}':
+
+{function_code}
+
+My current test(s) for this function:
+
+{existing_tests}
+
+I found {len(mutants)} bugs in this function that my test suite doesn't catch:
+
+{changes}
+
+Please generate one new test method for each change, in the same order, that would detect it. Each test should pass on the original code but fail if its mutation is applied.
+
+Return only the Python code for the {len(mutants)} test methods, properly indented, separated by a blank line and with docstrings explaining what they test.
+"""
+        
+        return prompt
+
+
+DEFAULT_FILE_HASHES_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mutation_guided', 'file_hashes.json')
+
+# LLM generator, mutmut work directory and project copy owned by each worker
+# process of the pair pool
+_worker_llm_generator = None
+_worker_mutmut_dir = None
+_worker_project_root = None
+_worker_copy_base = None
+_worker_copy_root = None
+
+# Left out of each worker's copy of the source and test trees: VCS data, environments and caches
+_PROJECT_COPY_IGNORE = shutil.ignore_patterns(
+    '.git', '.hg', '.tox', '.nox', '.venv', 'venv', 'node_modules', '__pycache__',
+    '.mutmut-cache', '.pytest_cache', '.mypy_cache'
+)
+
+
+def _init_worker(llm_api_key: Optional[str], mutmut_root: str, project_root: str,
+                 source_dir: str, test_dir: str) -> None:
+    """Set up the LLM generator, mutmut directory and project copy of a worker process.
+    
+    mutmut mutates source files in place, so workers sharing the project
+    would run each other's mutants through their tests. Each worker instead
+    copies the source and test trees, with the project's settings files,
+    and puts the copies of every import path inside them ahead of the
+    originals, so tests importing the project through PYTHONPATH or an
+    editable install load the mutated copy. Paths keep their layout
+    relative to project_root, the directory the pairs' paths are
+    relative to.
+    """
+    global _worker_llm_generator, _worker_mutmut_dir
+    global _worker_project_root, _worker_copy_base, _worker_copy_root
+    _worker_llm_generator = LLMTestGenerator(llm_api_key)
+    _worker_mutmut_dir = os.path.join(mutmut_root, f'mutmut-{os.getpid()}')
+    os.makedirs(_worker_mutmut_dir, exist_ok=True)
+    trees = [os.path.abspath(os.path.join(project_root, tree)) for tree in (source_dir, test_dir)]
+    _worker_project_root = project_root
+    _worker_copy_base = os.path.commonpath([project_root] + trees)
+    _worker_copy_root = os.path.join(mutmut_root, f'project-{os.getpid()}')
+    for tree in trees:
+        shutil.copytree(tree, _worker_path(tree), symlinks=True, ignore=_PROJECT_COPY_IGNORE,
+                        dirs_exist_ok=True)
+    local_root = _worker_path(project_root)
+    os.makedirs(local_root, exist_ok=True)
+    for name in ('setup.cfg', 'pyproject.toml', 'mutmut_config.py'):
+        try:
+            shutil.copyfile(os.path.join(project_root, name), os.path.join(local_root, name))
+        except FileNotFoundError:
+            pass
+    
+    pythonpath = os.environ.get('PYTHONPATH')
+    local_paths = []
+    for import_path in [project_root] + (pythonpath or '').split(os.pathsep) + sys.path:
+        import_path = os.path.abspath(import_path or os.curdir)
+        if os.path.commonpath([_worker_copy_base, import_path]) != _worker_copy_base:
+            continue
+        local_path = _worker_path(import_path)
+        if os.path.isdir(local_path) and local_path not in local_paths:
+            local_paths.append(local_path)
+    os.environ['PYTHONPATH'] = os.pathsep.join(filter(None, local_paths + [pythonpath]))
+    # Relative paths, and the project directory mutmut puts on PYTHONPATH, now resolve to the copy
+    os.chdir(local_root)
+
+
+def _worker_path(path: str) -> str:
+    """Return where path, relative to the project root or absolute, lies in this worker's copy."""
+    path = os.path.abspath(os.path.join(_worker_project_root, path))
+    return os.path.join(_worker_copy_root, os.path.relpath(path, _worker_copy_base))
+
+
+def _process_pair_in_worker(source_file: str, test_file: str,
+                            max_mutants: Optional[int]) -> Tuple[bool, Optional[str]]:
+    """Process one source/test pair with the worker's LLM generator.
+    
+    Raises SourceNotExecutedError if the tests did not execute the
+    worker's copy of the source file, so the pair can be processed where
+    its tests import it.
+    """
+    local_source, local_test = _worker_path(source_file), _worker_path(test_file)
+    improved, pair_hash = _process_pair(local_source, local_test, _worker_llm_generator,
+                                        _worker_mutmut_dir, max_mutants,
+                                        require_coverage=True)
+    # Carry the new tests over from the worker's copy to the project
+    if improved and not FileSystem.write_file(os.path.join(_worker_project_root, test_file),
+                                              FileSystem.read_file(local_test)):
+        return False, None
+    return improved, pair_hash
+
+
+def _process_pair(source_file: str, test_file: str, llm_generator: LLMTestGenerator,
+                  mutmut_dir: Optional[str] = None,
+                  max_mutants: Optional[int] = None,
+                  require_coverage: bool = False) -> Tuple[bool, Optional[str]]:
+    """Run mutation testing, test generation and verification for one pair.
+    
+    At most max_mutants surviving mutants are targeted (None for all).
+    mutmut and coverage keep their data in mutmut_dir, a temporary
+    directory if not given. Returns whether the test file was improved, and
+    the pair's content hash to record if it needs no further work (None
+    otherwise). With require_coverage, raises SourceNotExecutedError if
+    coverage does not show the tests executing source_file.
+    """
+    if mutmut_dir is None:
+        with tempfile.TemporaryDirectory(prefix='mutmut-') as mutmut_dir:
+            return _process_pair(source_file, test_file, llm_generator, mutmut_dir, max_mutants,
+                                 require_coverage)
+    
+    logger.info(f"\n--- Processing {source_file} with test file {test_file} ---")
+    
+    # Step 2: Run mutation testing, parsing one mutant past the cap to tell
+    # whether any were left over
+    try:
+        MutationTester.run_mutmut(source_file, test_file, mutmut_dir, require_coverage)
+        mutants_iter = MutationTester.iter_surviving_mutants(source_file, mutmut_dir)
+        mutants = list(islice(mutants_iter, None if max_mutants is None else max_mutants + 1))
+    except SourceNotExecutedError:
+        raise
+    except MutationTestingError as e:
+        logger.error(str(e))
+        return False, None
+    capped = max_mutants is not None and len(mutants) > max_mutants
+    
+    if not mutants:
+        logger.info(f"No surviving mutants found for {source_file}, skipping...")
+        return False, FileSystem.hash_files(source_file, test_file)
+    
+    if capped:
+        mutants = mutants[:max_mutants]
+        logger.info(f"Found more than {max_mutants} surviving mutants, targeting the first {max_mutants}")
+    else:
+        logger.info(f"Found {len(mutants)} surviving mutants")
+    
+    # Parse both files once for all mutants of this pair
+    CodeAnalyzer.warm_cache(source_file, test_file)
+    
+    # Step 3: Create LLM prompts based on the mutants, one per function so
+    # mutants in the same function share the function's context
+    groups = CodeAnalyzer.group_mutants_by_function(source_file, mutants)
+    prompts = []
+    for group in groups:
+        for mutant in group:
+            logger.debug("Processing mutant: %s", mutant['description'])
+        prompts.append(CodeAnalyzer.create_prompt_for_mutants(
+            source_file, test_file, group
+        ))
+    
+    # Step 4: Generate new tests using LLM, with requests in flight concurrently
+    new_tests = []
+    for test_code in llm_generator.generate_tests_batch(prompts, [len(group) for group in groups]):
+        if test_code:
+            new_tests.append(test_code)
+            logger.info("Generated new test for mutant")
+        else:
+            logger.warning("Failed to generate test for this mutant")
+    
+    if not new_tests:
+        logger.info(f"No new tests generated for {source_file}, skipping...")
+        return False, None
+        
+    # Step 5: Update test file with new tests
+    test_updated = FileSystem.update_test_file(
+        test_file, new_tests
+    )
+    
+    if not test_updated:
+        logger.error(f"Failed to update test file: {test_file}")
+        return False, None
+    
+    logger.info(f"Updated test file: {test_file}")
+    
+    # Step 6: Verify the effectiveness of new tests
+    verified, verification = TestRunner.verify_tests(
+        source_file, test_file, mutmut_dir
+    )
+    logger.info(f"Verification result: {verification}")
+    # Leave pairs with untargeted mutants, or whose new tests could not be
+    # verified, unrecorded so the next run targets them
+    return True, FileSystem.hash_files(source_file, test_file) if verified and not capped else None
 
 
 class MutationGuidedTestGenerator:
     """Main class that orchestrates the mutation-guided test generation process."""
     
-    def __init__(self, source_dir: str, test_dir: str, llm_api_key: Optional[str] = None):
-        """Initialize with source and test directories."""
+    def __init__(self, source_dir: str, test_dir: str, llm_api_key: Optional[str] = None,
+                 file_hashes_path: Optional[str] = DEFAULT_FILE_HASHES_PATH,
+                 jobs: Optional[int] = None, max_mutants_per_file: Optional[int] = 20):
+        """Initialize with source and test directories.
+        
+        Source/test pairs whose contents match a hash recorded in
+        file_hashes_path are skipped; pass None to always process every pair.
+        Pairs are processed by up to `jobs` worker processes (default: one
+        per CPU); jobs=1 processes them in this process. Each pair targets
+        at most max_mutants_per_file surviving mutants per run (None for all).
+        """
         self.source_dir = source_dir
         self.test_dir = test_dir
+        self.file_hashes_path = file_hashes_path
+        self.llm_api_key = llm_api_key
+        self.jobs = jobs or os.cpu_count() or 1
+        self.max_mutants_per_file = max_mutants_per_file
         self.llm_generator = LLMTestGenerator(llm_api_key)
         
         if not os.path.exists(source_dir):
@@ -463,6 +926,67 @@ class MutationGuidedTestGenerator:
         if not os.path.exists(test_dir):
             raise ValueError(f"Test directory does not exist: {test_dir}")
     
+    def _load_file_hashes(self) -> Dict[str, str]:
+        """Load the hashes of source/test pairs that needed no further work."""
+        if not self.file_hashes_path:
+            return {}
+        try:
+            with open(self.file_hashes_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable file hash cache {self.file_hashes_path}: {e}")
+            return {}
+    
+    def _save_file_hashes(self, file_hashes: Dict[str, str]) -> None:
+        """Persist the hashes of source/test pairs that needed no further work."""
+        if not self.file_hashes_path:
+            return
+        os.makedirs(os.path.dirname(self.file_hashes_path), exist_ok=True)
+        FileSystem.write_file(self.file_hashes_path, json.dumps(file_hashes, indent=2))
+    
+    def _process_pairs(self, pairs: List[Tuple[str, str]]) -> Iterator[Tuple[str, Tuple[bool, Optional[str]]]]:
+        """Yield (source_file, result) for each pair as its processing finishes.
+        
+        Each test file belongs to exactly one pair, so workers never write
+        the same file. Pairs whose tests did not execute a worker's copy of
+        the source file, such as tests importing the project from an
+        installed location, are processed again in this process once the
+        workers are done, so results do not depend on the number of jobs.
+        """
+        if self.jobs == 1 or len(pairs) <= 1:
+            for source_file, test_file in pairs:
+                yield source_file, _process_pair(source_file, test_file, self.llm_generator,
+                                                   max_mutants=self.max_mutants_per_file)
+            return
+        
+        # Each worker gets its own .mutmut-cache and copy of the source and test trees
+        serial_pairs = []
+        with tempfile.TemporaryDirectory(prefix='mutmut-') as mutmut_root, \
+                ProcessPoolExecutor(max_workers=min(self.jobs, len(pairs)),
+                                    initializer=_init_worker,
+                                    initargs=(self.llm_api_key, mutmut_root, os.getcwd(),
+                                              self.source_dir, self.test_dir)) as executor:
+            futures = {
+                executor.submit(_process_pair_in_worker, source_file, test_file,
+                                self.max_mutants_per_file): (source_file, test_file)
+                for source_file, test_file in pairs
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except SourceNotExecutedError:
+                    logger.warning(f"Tests did not execute a worker's copy of {futures[future][0]}, "
+                                   "processing it in this process")
+                    serial_pairs.append(futures[future])
+                    continue
+                yield futures[future][0], result
+        
+        for source_file, test_file in serial_pairs:
+            yield source_file, _process_pair(source_file, test_file, self.llm_generator,
+                                               max_mutants=self.max_mutants_per_file)
+    
     def run(self) -> str:
         """Run the mutation-guided test generation process."""
         logger.info(f"Starting mutation-guided test generation")
@@ -470,8 +994,10 @@ class MutationGuidedTestGenerator:
         logger.info(f"Test directory: {self.test_dir}")
         
         # Step 1: Locate source and test files
-        source_files = FileSystem.list_python_files(self.source_dir)
-        test_files = FileSystem.list_python_files(self.test_dir)
+        # Scan both trees at once; directory reads release the GIL
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_files, test_files = executor.map(FileSystem.list_python_files,
+                                                    [self.source_dir, self.test_dir])
         
         if not source_files:
             return "Could not find Python files in the source directory."
@@ -487,64 +1013,35 @@ class MutationGuidedTestGenerator:
             return "Could not map test files to source files. Make sure they follow naming conventions."
         
         improved_files_count = 0
+        unchanged_files_count = 0
+        file_hashes = self._load_file_hashes()
         
-        # Process each source file with corresponding test file
+        # Skip pairs that are unchanged since a run that left nothing to do
+        pending_pairs = []
         for source_file, test_file in file_mapping.items():
-            logger.info(f"\n--- Processing {source_file} with test file {test_file} ---")
-            
-            # Step 2: Run mutation testing
-            mutants = MutationTester.run_mutation_testing(source_file, test_file)
-            
-            if not mutants:
-                logger.info(f"No surviving mutants found for {source_file}, skipping...")
-                continue
-                
-            logger.info(f"Found {len(mutants)} surviving mutants")
-            
-            # Step 3 & 4: Generate LLM prompts and new tests
-            new_tests = []
-            for mutant in mutants:
-                logger.info(f"Processing mutant: {mutant['description']}")
-                
-                # Create LLM prompt based on the mutant
-                prompt = CodeAnalyzer.create_prompt_for_mutant(
-                    source_file, test_file, mutant
-                )
-                
-                # Generate new test using LLM
-                test_code = self.llm_generator.generate_test(prompt)
-                if test_code:
-                    new_tests.append(test_code)
-                    logger.info("Generated new test for mutant")
-                else:
-                    logger.warning("Failed to generate test for this mutant")
-            
-            if not new_tests:
-                logger.info(f"No new tests generated for {source_file}, skipping...")
-                continue
-                
-            # Step 5: Update test file with new tests
-            test_updated = FileSystem.update_test_file(
-                test_file, new_tests
-            )
-            
-            if test_updated:
-                improved_files_count += 1
-                logger.info(f"Updated test file: {test_file}")
-                
-                # Step 6: Verify the effectiveness of new tests
-                verification = TestRunner.verify_tests(
-                    source_file, test_file
-                )
-                logger.info(f"Verification result: {verification}")
+            pair_key = f"{os.path.abspath(source_file)}:{os.path.abspath(test_file)}"
+            if file_hashes.get(pair_key) == FileSystem.hash_files(source_file, test_file):
+                unchanged_files_count += 1
+                logger.info(f"{source_file} and {test_file} are unchanged since the last run, skipping...")
             else:
-                logger.error(f"Failed to update test file: {test_file}")
+                pending_pairs.append((source_file, test_file))
+        
+        # Process each remaining source file with its corresponding test file
+        for source_file, (improved, pair_hash) in self._process_pairs(pending_pairs):
+            if improved:
+                improved_files_count += 1
+            if pair_hash:
+                test_file = file_mapping[source_file]
+                file_hashes[f"{os.path.abspath(source_file)}:{os.path.abspath(test_file)}"] = pair_hash
+        
+        self._save_file_hashes(file_hashes)
         
         result = f"""
         Mutation-guided test generation completed.
         
         Summary:
         - Processed {len(file_mapping)} source/test file pairs
+        - Skipped {unchanged_files_count} pairs unchanged since the last run
         - Improved test coverage for {improved_files_count} files
         
         The test files have been updated with LLM-generated tests that target
@@ -563,6 +1060,7 @@ def main():
     parser.add_argument('--source_dir', required=True, help='Directory containing source code files')
     parser.add_argument('--test_dir', required=True, help='Directory containing test files')
     parser.add_argument('--api_key', help='API key for the LLM service (optional)')
+    parser.add_argument('--jobs', type=int, help='Number of source/test pairs to process in parallel (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -570,7 +1068,8 @@ def main():
         generator = MutationGuidedTestGenerator(
             source_dir=args.source_dir,
             test_dir=args.test_dir,
-            llm_api_key=args.api_key
+            llm_api_key=args.api_key,
+            jobs=args.jobs
         )
         result = generator.run()
         print(result)
@@ -0,0 +1,368 @@
+"""
+MutationTester module for running mutation testing using MutMut.
+"""
+
+import os
+import re
+import sys
+import json
+import shlex
+import shutil
+import tempfile
+import subprocess
+import logging
+import importlib.util
+import multiprocessing
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_HUNK_RE = re.compile(r'@@ -(\d+)')
+_STATUS_HEADING_RE = re.compile(r'(Timed out|Suspicious|Survived|Untested/skipped)\b.* \(\d+\)$')
+_FILE_HEADER_RE = re.compile(r'---- .* \(\d+\) ----$')
+
+# mutmut imports mutmut_config from sys.path and calls its pre_mutation hook
+# before testing each mutant; this one swaps in the test command that runs
+# only the tests covering the mutated line, where one was recorded
+_TEST_SELECTION_HOOK = '''\
+import json
+import os
+
+with open(os.path.join(os.path.dirname(__file__), 'test_commands.json'), encoding='utf-8') as f:
+    _TEST_COMMANDS = json.load(f)
+
+
+def pre_mutation(context):
+    command = _TEST_COMMANDS.get(str(context.current_line_index + 1))
+    if command:
+        context.config.test_command = command
+'''
+
+# Bit set in mutmut's exit code when the run itself failed; the other
+# bits only report which mutant outcomes occurred
+MUTMUT_FATAL_EXIT_BIT = 1
+
+class MutationTestingError(Exception):
+    """Raised when MutMut could not complete a mutation testing run."""
+
+class SourceNotExecutedError(MutationTestingError):
+    """Raised when coverage shows the tests never executed the given source file."""
+
+class MutationTester:
+    """Runs mutation testing using MutMut."""
+    
+    # Outcome of the installation check, decided once per process
+    _mutmut_installed: Optional[bool] = None
+    
+    @classmethod
+    def ensure_mutmut_installed(cls) -> bool:
+        """Ensure MutMut is installed."""
+        if cls._mutmut_installed is not None:
+            return cls._mutmut_installed
+        if importlib.util.find_spec('mutmut') is not None:
+            cls._mutmut_installed = True
+            return True
+        
+        try:
+            subprocess.run([sys.executable, '-m', 'pip', 'install', 'mutmut'], 
+                          check=True, 
+                          stdout=subprocess.PIPE, 
+                          stderr=subprocess.PIPE)
+            cls._mutmut_installed = True
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to install MutMut: {e}")
+            cls._mutmut_installed = False
+        return cls._mutmut_installed
+    
+    @staticmethod
+    def mutmut_env() -> Dict[str, str]:
+        """Environment for mutmut and test runs started outside the project directory."""
+        # Keep the project importable by the test runner
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.getcwd(), env.get('PYTHONPATH')]))
+        # Coverage data must land in the work directory, where mutmut reads it
+        env.pop('COVERAGE_FILE', None)
+        return env
+    
+    @staticmethod
+    def copy_project_settings(work_dir: str) -> None:
+        """Copy the project's settings files into work_dir, where mutmut reads its [mutmut] section."""
+        for name in ('setup.cfg', 'pyproject.toml'):
+            try:
+                shutil.copyfile(name, os.path.join(work_dir, name))
+            except FileNotFoundError:
+                pass
+    
+    @staticmethod
+    def _collect_coverage(source_file: str, test_file: str, **run_kwargs) -> Optional[Dict[int, List[str]]]:
+        """Record which tests of test_file execute each line of source_file.
+        
+        Returns the pytest node ids of the tests that executed each line of
+        source_file, for lines executed only from inside those tests, or
+        None if coverage could not be collected or does not include
+        source_file.
+        """
+        with tempfile.TemporaryDirectory(prefix='coverage-') as rc_dir:
+            # Record which test function executed each line
+            rc_file = os.path.join(rc_dir, '.coveragerc')
+            with open(rc_file, 'w', encoding='utf-8') as f:
+                f.write('[run]\ndynamic_context = test_function\n')
+            cmd = [
+                sys.executable, '-m', 'coverage', 'run',
+                f'--rcfile={rc_file}',
+                f'--include={source_file}',
+                '-m', 'pytest', '-q', test_file
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True, **run_kwargs)
+        if result.returncode != 0:
+            logger.warning(f"Could not collect coverage for {source_file}, running all tests per mutant")
+            return None
+        
+        try:
+            import coverage
+            
+            cwd = run_kwargs.get('cwd') or os.getcwd()
+            data = coverage.CoverageData(basename=os.path.join(cwd, '.coverage'))
+            data.read()
+            source_path = os.path.join(cwd, source_file)
+            measured_file = next(
+                (path for path in data.measured_files() if os.path.samefile(path, source_path)), None
+            )
+            if measured_file is None:
+                logger.warning(f"Coverage data does not include {source_file}, running all tests per mutant")
+                return None
+            contexts_by_line = data.contexts_by_lineno(measured_file)
+        except Exception as e:
+            logger.warning(f"Could not read test contexts from coverage data, running all tests per mutant: {e}")
+            return None
+        
+        # Contexts are "<test module>.<qualified test name>"; lines also run at
+        # import time or from other modules have contexts outside the test
+        # file and keep the full test command
+        module_name = os.path.splitext(os.path.basename(test_file))[0]
+        covering_tests = {}
+        for line_number, contexts in contexts_by_line.items():
+            test_ids = []
+            for context in contexts:
+                parts = context.split('.')
+                if module_name not in parts[:-1]:
+                    break
+                test_ids.append('::'.join([test_file] + parts[parts.index(module_name) + 1:]))
+            else:
+                if test_ids:
+                    covering_tests[line_number] = sorted(set(test_ids))
+        return covering_tests
+    
+    @staticmethod
+    def _write_test_selection_hook(hook_dir: str, runner: List[str],
+                                   covering_tests: Dict[int, List[str]]) -> None:
+        """Write a mutmut_config module that runs only the tests covering each mutant."""
+        # A handful of tests runs faster without xdist's worker startup
+        test_commands = {
+            line_number: shlex.join(runner + test_ids)
+            for line_number, test_ids in covering_tests.items()
+        }
+        with open(os.path.join(hook_dir, 'test_commands.json'), 'w', encoding='utf-8') as f:
+            json.dump(test_commands, f)
+        with open(os.path.join(hook_dir, 'mutmut_config.py'), 'w', encoding='utf-8') as f:
+            f.write(_TEST_SELECTION_HOOK)
+    
+    @staticmethod
+    def iter_output_lines(cmd: List[str], stderr=subprocess.STDOUT, fatal_exit_bits: int = -1,
+                          **run_kwargs) -> Iterator[str]:
+        """Run a command, yielding its output lines as they are written.
+        
+        Raises CalledProcessError once the output ends if the command was
+        killed or its exit code has any of fatal_exit_bits set (by default
+        any non-zero exit code).
+        """
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, text=True,
+                              **run_kwargs) as process:
+            for line in process.stdout:
+                yield line.rstrip('\n')
+        if process.returncode < 0 or process.returncode & fatal_exit_bits:
+            raise subprocess.CalledProcessError(process.returncode, cmd)
+    
+    @staticmethod
+    def _surviving_mutant_diffs(source_file: str, **run_kwargs) -> Dict[str, List[str]]:
+        """Return the diff lines of each surviving mutant of source_file, from one 'mutmut show'.
+        
+        .mutmut-cache holds the results of every file mutated from the same
+        directory, so the listing is limited to source_file, which must be
+        named as it was given to 'mutmut run'. The listing groups mutants under a heading per status ("Survived (3)",
+        "Timed out (1)", ...) and a "---- <file> (<count>) ----" header per
+        file, each mutant being "# mutant <id>" followed by its diff.
+        """
+        diffs = {}
+        status = None
+        diff_lines = None
+        # Parse the listing as it is written rather than buffering all of it
+        output_lines = MutationTester.iter_output_lines(
+            ['mutmut', 'show', source_file], stderr=subprocess.DEVNULL, **run_kwargs
+        )
+        for line in output_lines:
+            status_match = _STATUS_HEADING_RE.match(line)
+            if status_match:
+                status, diff_lines = status_match.group(1), None
+            elif _FILE_HEADER_RE.match(line):
+                diff_lines = None
+            elif line.startswith('# mutant '):
+                diff_lines = None
+                if status == 'Survived':
+                    diff_lines = diffs[line[len('# mutant '):].strip()] = []
+            elif diff_lines is not None:
+                diff_lines.append(line)
+        return diffs
+    
+    @staticmethod
+    def _parse_mutant_diff(diff_lines: List[str]) -> Tuple[int, str, str]:
+        """Return (line_number, original_line, mutated_line) from a mutant's diff."""
+        original_line = ""
+        mutated_line = ""
+        line_number = 0
+        
+        # One check of the first character per line; file headers are the
+        # only '-'/'+' lines that are not part of the change. The hunk header
+        # gives the first line of the hunk, which may start with context lines.
+        current_line = 0
+        for line in diff_lines:
+            marker = line[:1]
+            if marker == '-':
+                if not line.startswith('--- '):
+                    original_line = line[1:].strip()
+                    line_number = current_line
+                    current_line += 1
+            elif marker == '+':
+                if not line.startswith('+++ '):
+                    mutated_line = line[1:].strip()
+            elif marker == '@' and line.startswith('@@'):
+                match = _HUNK_RE.search(line)
+                if match:
+                    line_number = current_line = int(match.group(1))
+            else:
+                current_line += 1
+        return line_number, original_line, mutated_line
+    
+    @staticmethod
+    def run_mutmut(source_file: str, test_file: str, work_dir: str,
+                   require_coverage: bool = False) -> None:
+        """Run MutMut on source_file against test_file, keeping its results in work_dir.
+        
+        Coverage data and .mutmut-cache are written to work_dir, never to the
+        current directory, so concurrent runs must each be given their own.
+        Every mutant is tested: mutants on lines no test executes are the
+        ones most in need of new tests. Raises MutationTestingError if mutmut
+        is unavailable or fails, so that no survivors is never mistaken for
+        a run that could not tell. With require_coverage, raises
+        SourceNotExecutedError instead of running mutmut if coverage does not
+        show the tests executing source_file itself, as when they import
+        another copy of it.
+        """
+        if not MutationTester.ensure_mutmut_installed():
+            raise MutationTestingError("MutMut is not installed")
+        
+        try:
+            # Run mutmut on the source file
+            logger.info(f"Running mutation testing on {source_file}")
+            source_file, test_file = os.path.abspath(source_file), os.path.abspath(test_file)
+            run_kwargs = {'cwd': work_dir, 'env': MutationTester.mutmut_env()}
+            MutationTester.copy_project_settings(work_dir)
+            
+            cmd = [
+                'mutmut', 'run', 
+                f'--paths-to-mutate={source_file}',
+                f'--tests-dir={os.path.dirname(test_file)}',
+                '--no-progress',
+                '--simple-output'
+            ]
+            
+            # Run only the paired test file, spread over all cores when pytest-xdist
+            # is available and this run is not already one of several in parallel
+            runner = [sys.executable, '-m', 'pytest', '-x', '--assert=plain']
+            in_worker = multiprocessing.parent_process() is not None
+            xdist_args = ['-n', 'auto'] if not in_worker and importlib.util.find_spec('xdist') else []
+            cmd.append(f'--runner={shlex.join(runner + [test_file] + xdist_args)}')
+            
+            # Coverage only narrows which tests run per mutant; --use-coverage
+            # would make mutmut drop the mutants on uncovered lines entirely
+            covering_tests = MutationTester._collect_coverage(source_file, test_file, **run_kwargs)
+            if covering_tests is None and require_coverage:
+                raise SourceNotExecutedError(f"Tests in {test_file} did not execute {source_file}")
+            
+            with tempfile.TemporaryDirectory(prefix='mutmut-hook-') as hook_dir:
+                # Narrow each covered mutant's run to the tests that executed its line.
+                # The hook is a mutmut_config module ahead of the project on PYTHONPATH,
+                # so it is left out when the project has its own mutmut_config.py
+                mutmut_kwargs = dict(run_kwargs)
+                if covering_tests and not os.path.isfile('mutmut_config.py'):
+                    MutationTester._write_test_selection_hook(hook_dir, runner, covering_tests)
+                    env = dict(run_kwargs['env'])
+                    env['PYTHONPATH'] = os.pathsep.join(filter(None, [hook_dir, env.get('PYTHONPATH')]))
+                    mutmut_kwargs['env'] = env
+                
+                # Only mutmut's cache says which mutants survived, so its
+                # per-mutant status lines are passed through as they come;
+                # survivors set other bits of the exit code than a failed run
+                output_lines = MutationTester.iter_output_lines(
+                    cmd, fatal_exit_bits=MUTMUT_FATAL_EXIT_BIT, **mutmut_kwargs
+                )
+                for line in output_lines:
+                    logger.debug("mutmut: %s", line)
+            
+        except MutationTestingError:
+            raise
+        except Exception as e:
+            raise MutationTestingError(f"Error running mutation testing on {source_file}: {e}") from e
+    
+    @staticmethod
+    def iter_surviving_mutants(source_file: str, work_dir: str) -> Iterator[Dict[str, Any]]:
+        """Yield the mutants of source_file that survived the run_mutmut run in work_dir.
+        
+        Each mutant's diff is only parsed once the caller asks for it, so
+        consumers that stop early skip the rest. Raises MutationTestingError
+        if the results cannot be read.
+        """
+        try:
+            # mutmut records each mutant's outcome only in its cache, so the
+            # survivors and their diffs are read back in one listing afterwards
+            source_file = os.path.abspath(source_file)
+            diffs = MutationTester._surviving_mutant_diffs(
+                source_file, cwd=work_dir, env=MutationTester.mutmut_env()
+            )
+            for mutant_id, diff_lines in diffs.items():
+                # Parse the diff to understand the mutation
+                line_number, original_line, mutated_line = MutationTester._parse_mutant_diff(diff_lines)
+                
+                if original_line and mutated_line:
+                    yield {
+                        'id': mutant_id,
+                        'line_number': line_number,
+                        'original_line': original_line,
+                        'mutated_line': mutated_line,
+                        'description': f"Changed '{original_line}' to '{mutated_line}' at line {line_number}"
+                    }
+            
+        except Exception as e:
+            raise MutationTestingError(f"Error reading mutation testing results for {source_file}: {e}") from e
+    
+    @staticmethod
+    def run_mutation_testing(source_file: str, test_file: str,
+                             work_dir: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Run mutation testing using MutMut and return surviving mutants.
+        
+        Without a work_dir, mutmut runs in a temporary directory removed
+        afterwards. A failed run is logged and reported as no surviving
+        mutants.
+        """
+        if work_dir is None:
+            with tempfile.TemporaryDirectory(prefix='mutmut-') as work_dir:
+                return MutationTester.run_mutation_testing(source_file, test_file, work_dir)
+        
+        try:
+            MutationTester.run_mutmut(source_file, test_file, work_dir)
+            surviving_mutants = list(MutationTester.iter_surviving_mutants(source_file, work_dir))
+        except MutationTestingError as e:
+            logger.error(str(e))
+            return []
+        logger.info(f"Found {len(surviving_mutants)} surviving mutants")
+        return surviving_mutants
@@ -0,0 +1,71 @@
+"""
+PromptCache module for caching generated tests on disk by prompt hash.
+"""
+
+import os
+import hashlib
+import logging
+import sqlite3
+import threading
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+class PromptCache:
+    """On-disk cache of generated tests, keyed by prompt hash and safe to share between threads."""
+    
+    def __init__(self, cache_path: str):
+        """Open (creating if needed) the cache at cache_path.
+        
+        If the cache cannot be opened it is logged and every lookup misses.
+        """
+        self._lock = threading.Lock()
+        self._connection = self._open(cache_path)
+    
+    @staticmethod
+    def _open(cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open the sqlite database holding the cached tests."""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            connection = sqlite3.connect(cache_path, check_same_thread=False)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, test_code TEXT NOT NULL)"
+            )
+            connection.commit()
+            return connection
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not open prompt cache {cache_path}: {e}")
+            return None
+    
+    @staticmethod
+    def key(prompt: str) -> str:
+        """Hash a prompt, ignoring surrounding and trailing whitespace."""
+        normalized = '\n'.join(line.rstrip() for line in prompt.strip().splitlines())
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached test for a prompt hash, if any; read errors count as a miss."""
+        if self._connection is None:
+            return None
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT test_code FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read from prompt cache: {e}")
+            return None
+        return row[0] if row else None
+    
+    def put(self, key: str, test_code: str) -> None:
+        """Store a generated test under its prompt hash, logging rather than raising on failure."""
+        if self._connection is None:
+            return
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses (key, test_code) VALUES (?, ?)", (key, test_code)
+                )
+                self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write to prompt cache: {e}")
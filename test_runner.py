@@ -0,0 +1,87 @@
+"""
+TestRunner module for running tests and verifying their effectiveness.
+"""
+
+import os
+import sys
+import shlex
+import tempfile
+import subprocess
+import logging
+from typing import Optional, Tuple
+
+from mutation_tester import MUTMUT_FATAL_EXIT_BIT, MutationTester
+
+logger = logging.getLogger(__name__)
+
+class TestRunner:
+    """Runs tests and verifies their effectiveness."""
+    
+    @staticmethod
+    def verify_tests(source_file: str, test_file: str, work_dir: Optional[str] = None) -> Tuple[bool, str]:
+        """Run tests to verify they're working and killing mutants.
+        
+        Pass the work_dir mutation testing ran in, so mutmut reuses its
+        cache: killed mutants stay killed and only survivors are re-run.
+        Without a work_dir, mutmut runs in a temporary directory removed
+        afterwards. Returns whether the tests passed and mutmut completed,
+        and a message describing the result.
+        """
+        if work_dir is None:
+            with tempfile.TemporaryDirectory(prefix='mutmut-') as work_dir:
+                return TestRunner.verify_tests(source_file, test_file, work_dir)
+        
+        try:
+            # Run the tests
+            test_dir = os.path.dirname(test_file)
+            test_module = os.path.basename(test_file)[:-3]  # Remove .py
+            
+            logger.info(f"Running tests in {test_file}")
+            cmd = [sys.executable, '-m', 'unittest', f'{test_module}']
+            # Tests importing project modules need the project on the path too
+            result = subprocess.run(
+                cmd,
+                cwd=test_dir,
+                env=MutationTester.mutmut_env(),
+                capture_output=True,
+                text=True
+            )
+            
+            if result.returncode != 0:
+                error_msg = f"Tests failed to run: {result.stderr}"
+                logger.error(error_msg)
+                return False, error_msg
+            
+            # Run mutation testing again to see if mutants are now killed
+            logger.info("Running mutation testing again to verify improvement")
+            source_file, test_file = os.path.abspath(source_file), os.path.abspath(test_file)
+            run_kwargs = {'cwd': work_dir, 'env': MutationTester.mutmut_env()}
+            MutationTester.copy_project_settings(work_dir)
+            
+            runner = [sys.executable, '-m', 'pytest', '-x', '--assert=plain', test_file]
+            cmd = [
+                'mutmut', 'run', 
+                f'--paths-to-mutate={source_file}',
+                f'--tests-dir={os.path.dirname(test_file)}',
+                f'--runner={shlex.join(runner)}',
+                '--no-progress',
+                '--simple-output'
+            ]
+            
+            # Parse the output for mutation score as mutmut writes it
+            mutation_score = "Unknown"
+            output_lines = MutationTester.iter_output_lines(
+                cmd, stderr=subprocess.DEVNULL, fatal_exit_bits=MUTMUT_FATAL_EXIT_BIT, **run_kwargs
+            )
+            for line in output_lines:
+                if mutation_score == "Unknown" and "Mutation score" in line:
+                    mutation_score = line.strip()
+            
+            success_msg = f"Tests passed. {mutation_score}"
+            logger.info(success_msg)
+            return True, success_msg
+            
+        except Exception as e:
+            error_msg = f"Error verifying tests: {e}"
+            logger.error(error_msg)
+            return False, error_msg
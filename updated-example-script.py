@@ -21,7 +21,7 @@ def setup_example_project():
     os.makedirs(tests_dir)
     
     # Create calculator.py
-    calc_content = """# calculator.py
+    calc_content = '''# calculator.py
 
 def add(a, b):
     """Add two numbers and return the result."""
@@ -62,7 +62,7 @@ def is_prime(n):
             return False
         i += 6
     return True
-"""
+'''
     
     # Create test_calculator.py
     test_content = """# test_calculator.py
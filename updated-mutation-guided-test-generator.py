@@ -5,17 +5,22 @@ A tool that enhances test suites using mutation testing and GitHub Copilot-guide
 """
 
 import os
-import re
 import sys
-import subprocess
-import ast
+import json
 import argparse
-import glob
-from typing import List, Dict, Tuple, Any, Optional
+import shutil
+import tempfile
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Tuple, Optional
 import logging
 
 # Import our GitHub Copilot test generator
-from github_copilot_test_generator import GithubCopilotTestGenerator
+from code_analyzer import CodeAnalyzer
+from file_system import FileSystem
+from github_copilot_test_generator import DEFAULT_CACHE_PATH, GithubCopilotTestGenerator
+from mutation_tester import MutationTester, MutationTestingError, SourceNotExecutedError
+from test_runner import TestRunner
 
 # Configure logging
 logging.basicConfig(
@@ -25,23 +30,281 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Re-use the FileSystem, MutationTester, TestRunner, and CodeAnalyzer classes from your original code
-# [These classes would be included here, but I'm omitting them for brevity]
+DEFAULT_FILE_HASHES_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mutation_guided', 'file_hashes.json')
+
+# Copilot generator, mutmut work directory and project copy owned by each worker
+# process of the pair pool
+_worker_copilot_generator = None
+_worker_mutmut_dir = None
+_worker_project_root = None
+_worker_copy_base = None
+_worker_copy_root = None
+
+# Left out of each worker's copy of the source and test trees: VCS data, environments and caches
+_PROJECT_COPY_IGNORE = shutil.ignore_patterns(
+    '.git', '.hg', '.tox', '.nox', '.venv', 'venv', 'node_modules', '__pycache__',
+    '.mutmut-cache', '.pytest_cache', '.mypy_cache'
+)
+
+
+def _init_worker(vscode_path: Optional[str], max_workers: int, cache_path: Optional[str],
+                 mutmut_root: str, project_root: str,
+                 source_dir: str, test_dir: str) -> None:
+    """Set up the Copilot generator, mutmut directory and project copy of a worker process.
+    
+    mutmut mutates source files in place, so workers sharing the project
+    would run each other's mutants through their tests. Each worker instead
+    copies the source and test trees, with the project's settings files,
+    and puts the copies of every import path inside them ahead of the
+    originals, so tests importing the project through PYTHONPATH or an
+    editable install load the mutated copy. Paths keep their layout
+    relative to project_root, the directory the pairs' paths are
+    relative to.
+    """
+    global _worker_copilot_generator, _worker_mutmut_dir
+    global _worker_project_root, _worker_copy_base, _worker_copy_root
+    _worker_copilot_generator = GithubCopilotTestGenerator(vscode_path, max_workers, cache_path)
+    _worker_mutmut_dir = os.path.join(mutmut_root, f'mutmut-{os.getpid()}')
+    os.makedirs(_worker_mutmut_dir, exist_ok=True)
+    trees = [os.path.abspath(os.path.join(project_root, tree)) for tree in (source_dir, test_dir)]
+    _worker_project_root = project_root
+    _worker_copy_base = os.path.commonpath([project_root] + trees)
+    _worker_copy_root = os.path.join(mutmut_root, f'project-{os.getpid()}')
+    for tree in trees:
+        shutil.copytree(tree, _worker_path(tree), symlinks=True, ignore=_PROJECT_COPY_IGNORE,
+                        dirs_exist_ok=True)
+    local_root = _worker_path(project_root)
+    os.makedirs(local_root, exist_ok=True)
+    for name in ('setup.cfg', 'pyproject.toml', 'mutmut_config.py'):
+        try:
+            shutil.copyfile(os.path.join(project_root, name), os.path.join(local_root, name))
+        except FileNotFoundError:
+            pass
+    
+    pythonpath = os.environ.get('PYTHONPATH')
+    local_paths = []
+    for import_path in [project_root] + (pythonpath or '').split(os.pathsep) + sys.path:
+        import_path = os.path.abspath(import_path or os.curdir)
+        if os.path.commonpath([_worker_copy_base, import_path]) != _worker_copy_base:
+            continue
+        local_path = _worker_path(import_path)
+        if os.path.isdir(local_path) and local_path not in local_paths:
+            local_paths.append(local_path)
+    os.environ['PYTHONPATH'] = os.pathsep.join(filter(None, local_paths + [pythonpath]))
+    # Relative paths, and the project directory mutmut puts on PYTHONPATH, now resolve to the copy
+    os.chdir(local_root)
+
+
+def _worker_path(path: str) -> str:
+    """Return where path, relative to the project root or absolute, lies in this worker's copy."""
+    path = os.path.abspath(os.path.join(_worker_project_root, path))
+    return os.path.join(_worker_copy_root, os.path.relpath(path, _worker_copy_base))
+
+
+def _process_pair_in_worker(source_file: str, test_file: str,
+                            max_mutants: Optional[int]) -> Tuple[bool, Optional[str]]:
+    """Process one source/test pair with the worker's Copilot generator.
+    
+    Raises SourceNotExecutedError if the tests did not execute the
+    worker's copy of the source file, so the pair can be processed where
+    its tests import it.
+    """
+    local_source, local_test = _worker_path(source_file), _worker_path(test_file)
+    improved, pair_hash = _process_pair(local_source, local_test, _worker_copilot_generator,
+                                        _worker_mutmut_dir, max_mutants,
+                                        require_coverage=True)
+    # Carry the new tests over from the worker's copy to the project
+    if improved and not FileSystem.write_file(os.path.join(_worker_project_root, test_file),
+                                              FileSystem.read_file(local_test)):
+        return False, None
+    return improved, pair_hash
+
+
+def _process_pair(source_file: str, test_file: str, copilot_generator: GithubCopilotTestGenerator,
+                  mutmut_dir: Optional[str] = None,
+                  max_mutants: Optional[int] = None,
+                  require_coverage: bool = False) -> Tuple[bool, Optional[str]]:
+    """Run mutation testing, test generation and verification for one pair.
+    
+    At most max_mutants surviving mutants are targeted (None for all).
+    mutmut and coverage keep their data in mutmut_dir, a temporary
+    directory if not given. Returns whether the test file was improved, and
+    the pair's content hash to record if it needs no further work (None
+    otherwise). With require_coverage, raises SourceNotExecutedError if
+    coverage does not show the tests executing source_file.
+    """
+    if mutmut_dir is None:
+        with tempfile.TemporaryDirectory(prefix='mutmut-') as mutmut_dir:
+            return _process_pair(source_file, test_file, copilot_generator, mutmut_dir, max_mutants,
+                                 require_coverage)
+    
+    logger.info(f"\n--- Processing {source_file} with test file {test_file} ---")
+    
+    # Step 2: Run mutation testing, parsing one mutant past the cap to tell
+    # whether any were left over
+    try:
+        MutationTester.run_mutmut(source_file, test_file, mutmut_dir, require_coverage)
+        mutants_iter = MutationTester.iter_surviving_mutants(source_file, mutmut_dir)
+        mutants = list(islice(mutants_iter, None if max_mutants is None else max_mutants + 1))
+    except SourceNotExecutedError:
+        raise
+    except MutationTestingError as e:
+        logger.error(str(e))
+        return False, None
+    capped = max_mutants is not None and len(mutants) > max_mutants
+    
+    if not mutants:
+        logger.info(f"No surviving mutants found for {source_file}, skipping...")
+        return False, FileSystem.hash_files(source_file, test_file)
+    
+    if capped:
+        mutants = mutants[:max_mutants]
+        logger.info(f"Found more than {max_mutants} surviving mutants, targeting the first {max_mutants}")
+    else:
+        logger.info(f"Found {len(mutants)} surviving mutants")
+    
+    # Parse both files once for all mutants of this pair
+    CodeAnalyzer.warm_cache(source_file, test_file)
+    
+    # Step 3: Create Copilot prompts based on the mutants, one per function so
+    # each session covers all of the function's mutants
+    prompts = []
+    for group in CodeAnalyzer.group_mutants_by_function(source_file, mutants):
+        for mutant in group:
+            logger.debug("Processing mutant: %s", mutant['description'])
+        prompts.append(CodeAnalyzer.create_prompt_for_mutants(
+            source_file, test_file, group
+        ))
+    
+    # Step 4: Generate new tests using GitHub Copilot, with sessions open concurrently
+    new_tests = []
+    for test_code in copilot_generator.generate_tests_batch(prompts):
+        if test_code:
+            new_tests.append(test_code)
+            logger.info("Generated new test for mutant using GitHub Copilot")
+        else:
+            logger.warning("Failed to generate test for this mutant")
+    
+    if not new_tests:
+        logger.info(f"No new tests generated for {source_file}, skipping...")
+        return False, None
+        
+    # Step 5: Update test file with new tests
+    test_updated = FileSystem.update_test_file(
+        test_file, new_tests
+    )
+    
+    if not test_updated:
+        logger.error(f"Failed to update test file: {test_file}")
+        return False, None
+    
+    logger.info(f"Updated test file: {test_file}")
+    
+    # Step 6: Verify the effectiveness of new tests
+    verified, verification = TestRunner.verify_tests(
+        source_file, test_file, mutmut_dir
+    )
+    logger.info(f"Verification result: {verification}")
+    # Leave pairs with untargeted mutants, or whose new tests could not be
+    # verified, unrecorded so the next run targets them
+    return True, FileSystem.hash_files(source_file, test_file) if verified and not capped else None
+
 
 class MutationGuidedTestGenerator:
     """Main class that orchestrates the mutation-guided test generation process."""
     
-    def __init__(self, source_dir: str, test_dir: str, vscode_path: Optional[str] = None):
-        """Initialize with source and test directories."""
+    def __init__(self, source_dir: str, test_dir: str, vscode_path: Optional[str] = None,
+                 file_hashes_path: Optional[str] = DEFAULT_FILE_HASHES_PATH,
+                 jobs: Optional[int] = None, max_workers: int = 8,
+                 max_mutants_per_file: Optional[int] = 20, use_cache: bool = True):
+        """Initialize with source and test directories.
+        
+        Source/test pairs whose contents match a hash recorded in
+        file_hashes_path are skipped; pass None to always process every pair.
+        Pairs are processed by up to `jobs` worker processes (default: one
+        per CPU); jobs=1 processes them in this process. Each pair keeps up
+        to `max_workers` Copilot sessions open at once, and targets at most
+        max_mutants_per_file surviving mutants per run (None for all).
+        With use_cache, tests accepted from Copilot are reused for identical
+        prompts in later runs.
+        """
         self.source_dir = source_dir
         self.test_dir = test_dir
-        self.copilot_generator = GithubCopilotTestGenerator(vscode_path)
+        self.file_hashes_path = file_hashes_path
+        self.vscode_path = vscode_path
+        self.jobs = jobs or os.cpu_count() or 1
+        self.max_mutants_per_file = max_mutants_per_file
+        self.max_workers = max_workers
+        self.copilot_cache_path = DEFAULT_CACHE_PATH if use_cache else None
+        self.copilot_generator = GithubCopilotTestGenerator(vscode_path, max_workers, self.copilot_cache_path)
         
         if not os.path.exists(source_dir):
             raise ValueError(f"Source directory does not exist: {source_dir}")
         if not os.path.exists(test_dir):
             raise ValueError(f"Test directory does not exist: {test_dir}")
     
+    def _load_file_hashes(self) -> Dict[str, str]:
+        """Load the hashes of source/test pairs that needed no further work."""
+        if not self.file_hashes_path:
+            return {}
+        try:
+            with open(self.file_hashes_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable file hash cache {self.file_hashes_path}: {e}")
+            return {}
+    
+    def _save_file_hashes(self, file_hashes: Dict[str, str]) -> None:
+        """Persist the hashes of source/test pairs that needed no further work."""
+        if not self.file_hashes_path:
+            return
+        os.makedirs(os.path.dirname(self.file_hashes_path), exist_ok=True)
+        FileSystem.write_file(self.file_hashes_path, json.dumps(file_hashes, indent=2))
+    
+    def _process_pairs(self, pairs: List[Tuple[str, str]]) -> Iterator[Tuple[str, Tuple[bool, Optional[str]]]]:
+        """Yield (source_file, result) for each pair as its processing finishes.
+        
+        Each test file belongs to exactly one pair, so workers never write
+        the same file. Pairs whose tests did not execute a worker's copy of
+        the source file, such as tests importing the project from an
+        installed location, are processed again in this process once the
+        workers are done, so results do not depend on the number of jobs.
+        """
+        if self.jobs == 1 or len(pairs) <= 1:
+            for source_file, test_file in pairs:
+                yield source_file, _process_pair(source_file, test_file, self.copilot_generator,
+                                                   max_mutants=self.max_mutants_per_file)
+            return
+        
+        # Each worker gets its own .mutmut-cache and copy of the source and test trees
+        serial_pairs = []
+        with tempfile.TemporaryDirectory(prefix='mutmut-') as mutmut_root, \
+                ProcessPoolExecutor(max_workers=min(self.jobs, len(pairs)),
+                                    initializer=_init_worker,
+                                    initargs=(self.vscode_path, self.max_workers,
+                                              self.copilot_cache_path, mutmut_root, os.getcwd(),
+                                              self.source_dir, self.test_dir)) as executor:
+            futures = {
+                executor.submit(_process_pair_in_worker, source_file, test_file,
+                                self.max_mutants_per_file): (source_file, test_file)
+                for source_file, test_file in pairs
+            }
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except SourceNotExecutedError:
+                    logger.warning(f"Tests did not execute a worker's copy of {futures[future][0]}, "
+                                   "processing it in this process")
+                    serial_pairs.append(futures[future])
+                    continue
+                yield futures[future][0], result
+        
+        for source_file, test_file in serial_pairs:
+            yield source_file, _process_pair(source_file, test_file, self.copilot_generator,
+                                               max_mutants=self.max_mutants_per_file)
+    
     def run(self) -> str:
         """Run the mutation-guided test generation process."""
         logger.info(f"Starting mutation-guided test generation with GitHub Copilot")
@@ -49,8 +312,10 @@ class MutationGuidedTestGenerator:
         logger.info(f"Test directory: {self.test_dir}")
         
         # Step 1: Locate source and test files
-        source_files = FileSystem.list_python_files(self.source_dir)
-        test_files = FileSystem.list_python_files(self.test_dir)
+        # Scan both trees at once; directory reads release the GIL
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            source_files, test_files = executor.map(FileSystem.list_python_files,
+                                                    [self.source_dir, self.test_dir])
         
         if not source_files:
             return "Could not find Python files in the source directory."
@@ -66,64 +331,35 @@ class MutationGuidedTestGenerator:
             return "Could not map test files to source files. Make sure they follow naming conventions."
         
         improved_files_count = 0
+        unchanged_files_count = 0
+        file_hashes = self._load_file_hashes()
         
-        # Process each source file with corresponding test file
+        # Skip pairs that are unchanged since a run that left nothing to do
+        pending_pairs = []
         for source_file, test_file in file_mapping.items():
-            logger.info(f"\n--- Processing {source_file} with test file {test_file} ---")
-            
-            # Step 2: Run mutation testing
-            mutants = MutationTester.run_mutation_testing(source_file, test_file)
-            
-            if not mutants:
-                logger.info(f"No surviving mutants found for {source_file}, skipping...")
-                continue
-                
-            logger.info(f"Found {len(mutants)} surviving mutants")
-            
-            # Step 3 & 4: Generate Copilot prompts and new tests
-            new_tests = []
-            for mutant in mutants:
-                logger.info(f"Processing mutant: {mutant['description']}")
-                
-                # Create prompt based on the mutant
-                prompt = CodeAnalyzer.create_prompt_for_mutant(
-                    source_file, test_file, mutant
-                )
-                
-                # Generate new test using GitHub Copilot
-                test_code = self.copilot_generator.generate_test(prompt)
-                if test_code:
-                    new_tests.append(test_code)
-                    logger.info("Generated new test for mutant using GitHub Copilot")
-                else:
-                    logger.warning("Failed to generate test for this mutant")
-            
-            if not new_tests:
-                logger.info(f"No new tests generated for {source_file}, skipping...")
-                continue
-                
-            # Step 5: Update test file with new tests
-            test_updated = FileSystem.update_test_file(
-                test_file, new_tests
-            )
-            
-            if test_updated:
-                improved_files_count += 1
-                logger.info(f"Updated test file: {test_file}")
-                
-                # Step 6: Verify the effectiveness of new tests
-                verification = TestRunner.verify_tests(
-                    source_file, test_file
-                )
-                logger.info(f"Verification result: {verification}")
+            pair_key = f"{os.path.abspath(source_file)}:{os.path.abspath(test_file)}"
+            if file_hashes.get(pair_key) == FileSystem.hash_files(source_file, test_file):
+                unchanged_files_count += 1
+                logger.info(f"{source_file} and {test_file} are unchanged since the last run, skipping...")
             else:
-                logger.error(f"Failed to update test file: {test_file}")
+                pending_pairs.append((source_file, test_file))
+        
+        # Process each remaining source file with its corresponding test file
+        for source_file, (improved, pair_hash) in self._process_pairs(pending_pairs):
+            if improved:
+                improved_files_count += 1
+            if pair_hash:
+                test_file = file_mapping[source_file]
+                file_hashes[f"{os.path.abspath(source_file)}:{os.path.abspath(test_file)}"] = pair_hash
+        
+        self._save_file_hashes(file_hashes)
         
         result = f"""
         Mutation-guided test generation completed.
         
         Summary:
         - Processed {len(file_mapping)} source/test file pairs
+        - Skipped {unchanged_files_count} pairs unchanged since the last run
         - Improved test coverage for {improved_files_count} files
         
         The test files have been updated with GitHub Copilot-generated tests that target
@@ -142,6 +378,7 @@ def main():
     parser.add_argument('--source_dir', required=True, help='Directory containing source code files')
     parser.add_argument('--test_dir', required=True, help='Directory containing test files')
     parser.add_argument('--vscode_path', help='Path to VS Code executable (optional)')
+    parser.add_argument('--jobs', type=int, help='Number of source/test pairs to process in parallel (default: CPU count)')
     
     args = parser.parse_args()
     
@@ -149,7 +386,8 @@ def main():
         generator = MutationGuidedTestGenerator(
             source_dir=args.source_dir,
             test_dir=args.test_dir,
-            vscode_path=args.vscode_path
+            vscode_path=args.vscode_path,
+            jobs=args.jobs
         )
         result = generator.run()
         print(result)